@@ -0,0 +1,179 @@
+# analytics.py
+# Statistics over the whole PastGames history, computed with vectorized pandas group-bys instead of Python loops.
+#
+# PastGamesStats keeps running totals per (team, sport) and per (sport, team, opponent). refresh() reads only the
+# games added since the previous refresh and adds their totals in, so keeping the statistics current costs time in
+# proportion to the new games rather than the whole history. get_stats() returns one instance shared by every
+# session, refreshed only after PastGames changes (see notifications.py).
+#
+# Events scored per player (scoring.PLACEMENT_POINTS) record places rather than two teams and are left out.
+# A game counts as overtime when a Multi Play game is won by 2 or less, as in scoring.score_match.
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+import database
+import notifications
+from scoring import PLACEMENT_POINTS
+
+OVERTIME_MARGIN = 2
+
+_TOTALS = ["games", "wins", "losses", "draws", "points_for", "points_against", "overtime"]
+_HEAD_TO_HEAD = ["games", "wins"]
+
+
+def _empty(names: list, columns: list):
+    index = pd.MultiIndex.from_arrays([[] for _ in names], names=names)
+    return pd.DataFrame({column: pd.Series(dtype="int64") for column in columns}, index=index)
+
+
+def _rates(totals: pd.DataFrame):
+    games = totals["games"]
+    return totals.assign(
+        win_rate=totals["wins"] / games,
+        avg_margin=(totals["points_for"] - totals["points_against"]) / games,
+        overtime_rate=totals["overtime"] / games,
+        points_per_game=totals["points_for"] / games,
+    )
+
+
+class PastGamesStats:
+    """
+    Running totals over PastGames, kept current by refresh().
+      - totals: games, wins, losses, draws, points_for, points_against and overtime per (team, sport)
+      - head_to_head_totals: games and wins per (sport, team, opponent), seen from the team's side
+      - last_id / rows: the highest PastGames id and the number of rows read so far
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets every game read so far.
+        """
+        self.last_id = 0
+        self.rows = 0
+        self.totals = _empty(["team", "sport"], _TOTALS)
+        self.head_to_head_totals = _empty(["sport", "team", "opponent"], _HEAD_TO_HEAD)
+
+    def refresh(self, chunk_size: int = 50000):
+        """
+        Adds the games recorded since the last refresh. If games were deleted meanwhile (e.g. by clear_database)
+        everything is read again. Returns the number of rows read.
+        """
+        if self.rows and database.count_past_games(self.last_id) != self.rows:
+            self.reset()
+        overtime_sports = {game["name"] for game in database.get_all_games() if game["type"] == "Multi Play"}
+        read = 0
+        for chunk in database.iter_past_games(self.last_id, chunk_size):
+            self.add_games(pd.DataFrame.from_records(chunk, columns=database.PAST_GAME_COLUMNS), overtime_sports)
+            read += len(chunk)
+        return read
+
+    def add_games(self, games: pd.DataFrame, overtime_sports: set = ()):
+        """
+        Adds a frame of PastGames rows (PAST_GAME_COLUMNS) to the totals. overtime_sports are the sports
+        in which a win by OVERTIME_MARGIN or less counts as overtime.
+        """
+        if games.empty:
+            return
+        self.last_id = max(self.last_id, int(games["id"].max()))
+        self.rows += len(games)
+        games = games[
+            ~games["sport"].isin(list(PLACEMENT_POINTS)) & games["team1"].notna() & games["team2"].notna()
+        ]
+        if games.empty:
+            return
+
+        # Every game is counted once from each side.
+        team1 = games["team1"].to_numpy()
+        team2 = games["team2"].to_numpy()
+        score1 = games["team1_score"].fillna(0).to_numpy(dtype="int64")
+        score2 = games["team2_score"].fillna(0).to_numpy(dtype="int64")
+        sport = games["sport"].to_numpy()
+        points_for = np.concatenate([score1, score2])
+        points_against = np.concatenate([score2, score1])
+        margin = points_for - points_against
+        overtime_game = np.isin(sport, list(overtime_sports))
+        sides = pd.DataFrame({
+            "team": np.concatenate([team1, team2]),
+            "opponent": np.concatenate([team2, team1]),
+            "sport": np.concatenate([sport, sport]),
+            "games": 1,
+            "wins": (margin > 0).astype("int64"),
+            "losses": (margin < 0).astype("int64"),
+            "draws": (margin == 0).astype("int64"),
+            "points_for": points_for,
+            "points_against": points_against,
+            "overtime": (
+                np.concatenate([overtime_game, overtime_game]) & (margin != 0) & (np.abs(margin) <= OVERTIME_MARGIN)
+            ).astype("int64"),
+        })
+        self.totals = self.totals.add(
+            sides.groupby(["team", "sport"], sort=False)[_TOTALS].sum(), fill_value=0
+        ).astype("int64")
+        self.head_to_head_totals = self.head_to_head_totals.add(
+            sides.groupby(["sport", "team", "opponent"], sort=False)[_HEAD_TO_HEAD].sum(), fill_value=0
+        ).astype("int64")
+
+    def sports(self):
+        """
+        The sports with at least one game, sorted by name.
+        """
+        return sorted(self.totals.index.unique(level="sport"))
+
+    def team_sport_stats(self, sport: str = None):
+        """
+        One row per team and sport (only `sport` if given) with the totals plus
+        win_rate, avg_margin, overtime_rate and points_per_game.
+        """
+        totals = self.totals
+        if sport is not None:
+            totals = totals[totals.index.get_level_values("sport") == sport]
+        return _rates(totals).reset_index().sort_values(["sport", "win_rate", "games"], ascending=[True, False, False])
+
+    def team_stats(self):
+        """
+        The same statistics per team over every sport.
+        """
+        return _rates(self.totals.groupby(level="team").sum()).reset_index().sort_values(
+            ["win_rate", "games"], ascending=False
+        )
+
+    def head_to_head(self, sport: str = None, value: str = "wins"):
+        """
+        A team x opponent matrix of the row team's wins against the column team (value="games" for games played),
+        over every sport or only `sport`.
+        """
+        if value not in _HEAD_TO_HEAD:
+            raise ValueError(f"Unknown head-to-head value: {value}")
+        totals = self.head_to_head_totals
+        if sport is not None:
+            totals = totals[totals.index.get_level_values("sport") == sport]
+        matrix = totals[value].groupby(level=["team", "opponent"]).sum().unstack(fill_value=0)
+        teams = matrix.index.union(matrix.columns)
+        return matrix.reindex(index=teams, columns=teams, fill_value=0)
+
+
+_stats = PastGamesStats()
+_stats_version = None
+_stats_lock = threading.Lock()
+
+
+def get_stats():
+    """
+    Returns the PastGamesStats shared by every session of the process, after adding any games recorded since
+    PastGames last changed. Reruns cost no queries until a game is recorded. Treat the result as read-only.
+    """
+    global _stats_version
+    notifications.listen()
+    with _stats_lock:
+        # Read before refreshing, so a game recorded during the refresh makes the next call refresh again.
+        version = notifications.version("PastGames")
+        if version != _stats_version:
+            _stats.refresh()
+            _stats_version = version
+        return _stats
@@ -0,0 +1,155 @@
+# async_database.py
+# Asyncio versions of the read functions in database.py, so a page can run its independent reads concurrently.
+# Uses SQLAlchemy's async engine with asyncpg (Postgres) or aiosqlite (embedded SQLite), chosen like storage.py.
+#
+# Streamlit runs each session's script in its own thread, while pooled async connections belong to the event loop
+# that opened them. All coroutines therefore run on one background event loop; call run() to wait for a result.
+
+import asyncio
+import threading
+from uuid import uuid4
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+import instrumentation
+import storage
+from database import DashboardSnapshot, _leaderboard_query, _leaderboard_rows
+
+_engine = None
+_loop = None
+_lock = threading.Lock()
+
+
+def create_async_storage_engine(backend: str = None):
+    """
+    Creates an async engine for the given backend name, or for GAME_DB_BACKEND if none is given.
+    """
+    backend = (backend or storage.BACKEND).lower()
+    if backend == "postgres":
+        url = make_url(storage.postgres_url()).set(drivername="postgresql+asyncpg")
+        # The Supabase pooler runs in transaction mode, which breaks asyncpg's cached prepared statements.
+        return create_async_engine(
+            url,
+            connect_args={
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        )
+    if backend == "sqlite":
+        import aiosqlite
+
+        path = storage.SQLITE_PATH
+
+        async def connect():
+            conn = await aiosqlite.connect(":memory:", timeout=30)
+            # Same layout as the sync engine: the database file is attached as "public".
+            await conn.execute("ATTACH DATABASE ? AS public", (path,))
+            return conn
+
+        # A pool of connections is what lets reads overlap; an in-memory database needs a single shared one.
+        poolclass = StaticPool if path == ":memory:" else AsyncAdaptedQueuePool
+        return create_async_engine("sqlite+aiosqlite://", async_creator=connect, poolclass=poolclass)
+    raise ValueError(f"Unknown storage backend: {backend}")
+
+
+def get_async_engine():
+    """
+    Returns the process-wide async engine, creating it on first use.
+    """
+    global _engine
+    with _lock:
+        if _engine is None:
+            _engine = create_async_storage_engine()
+            instrumentation.install(_engine.sync_engine)
+        return _engine
+
+
+def run(coro):
+    """
+    Runs a coroutine on the shared background event loop and returns its result.
+    """
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="async-database", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+async def _fetch_all(query, params=None):
+    async with get_async_engine().connect() as conn:
+        result = await conn.execute(query, params or {})
+        return [dict(row._mapping) for row in result]
+
+
+async def get_all_teams():
+    """
+    Retrieves all teams from the public.Teams table.
+    """
+    return await _fetch_all(text('SELECT * FROM public."Teams" ORDER BY id'))
+
+
+async def get_tokens_for_teams(team_ids=None):
+    """
+    Retrieve the tokens of several teams (or of every team if team_ids is None) as team_id -> {token_name: count}.
+    """
+    if team_ids is None:
+        rows = await _fetch_all(text('SELECT team_id, token_name, count FROM public."TeamTokens"'))
+        tokens_by_team = {}
+    else:
+        team_ids = list(team_ids)
+        if not team_ids:
+            return {}
+        query = text(
+            'SELECT team_id, token_name, count FROM public."TeamTokens" WHERE team_id IN :team_ids'
+        ).bindparams(bindparam("team_ids", expanding=True))
+        rows = await _fetch_all(query, {"team_ids": team_ids})
+        tokens_by_team = {team_id: {} for team_id in team_ids}
+    for row in rows:
+        tokens_by_team.setdefault(row["team_id"], {})[row["token_name"]] = row["count"]
+    return tokens_by_team
+
+
+async def get_all_non_game_rules():
+    """
+    Retrieves all non-game rules, newest first.
+    """
+    return await _fetch_all(text('SELECT rule, penalty FROM public."NonGameRule" ORDER BY updated_at DESC'))
+
+
+async def get_leaderboard(limit: int = 10, after_score: float = None, after_id: int = None):
+    """
+    Retrieves teams in leaderboard order; see database.get_leaderboard().
+    """
+    query, params = _leaderboard_query(limit, after_score, after_id)
+    async with get_async_engine().connect() as conn:
+        return _leaderboard_rows(await conn.execute(query, params))
+
+
+async def load_dashboard_snapshot() -> DashboardSnapshot:
+    """
+    Loads the same DashboardSnapshot as database.load_dashboard_snapshot(), running the three reads concurrently.
+    """
+    teams, tokens_by_team, rules = await asyncio.gather(
+        get_all_teams(),
+        get_tokens_for_teams(),
+        get_all_non_game_rules(),
+    )
+    for team in teams:
+        tokens_by_team.setdefault(team["id"], {})
+    return DashboardSnapshot(
+        teams=teams,
+        tokens_by_team=tokens_by_team,
+        non_game_rules=rules,
+    )
+
+
+async def load_home_page(top_n: int = 10):
+    """
+    Loads everything the Home page reads: the dashboard snapshot and the top of the leaderboard, concurrently.
+    Returns (snapshot, leaderboard_entries).
+    """
+    return await asyncio.gather(load_dashboard_snapshot(), get_leaderboard(limit=top_n))
@@ -0,0 +1,100 @@
+# benchmarks/async_vs_sync.py
+# Compares the ways of loading the Home page's data against the configured database (see storage.py):
+#
+#   sync sequential   one query per read, one after another (how pages loaded before the snapshot loader)
+#   sync snapshot     database.load_dashboard_snapshot() plus the leaderboard query
+#   async gather      async_database.load_home_page(), all reads concurrently
+#
+# Network latency is what the async path hides, so run it against the remote database for meaningful numbers:
+#   python benchmarks/async_vs_sync.py --repeat 50 --json async_vs_sync.json
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Every load should reach the database; cached reads (see cache.py) would hide the round trips being compared.
+os.environ["GAME_CACHE_BACKEND"] = "off"
+
+from sqlalchemy import event
+
+import async_database
+import database
+
+
+def _sync_sequential(top_n):
+    teams = database.get_all_teams()
+    database.get_tokens_for_teams([team["id"] for team in teams])
+    database.get_all_non_game_rules()
+    database.get_leaderboard(limit=top_n)
+
+
+def _sync_snapshot(top_n):
+    database.load_dashboard_snapshot()
+    database.get_leaderboard(limit=top_n)
+
+
+def _async_gather(top_n):
+    async_database.run(async_database.load_home_page(top_n))
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def measure(name, load, top_n, repeat, warmup, counter):
+    for _ in range(warmup):
+        load(top_n)
+    counter["statements"] = 0
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load(top_n)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "path": name,
+        "runs": repeat,
+        "mean_ms": statistics.mean(samples),
+        "p50_ms": _percentile(samples, 0.50),
+        "p95_ms": _percentile(samples, 0.95),
+        "statements_per_load": counter["statements"] / repeat,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare sync and async loading of the Home page data.")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    counter = {"statements": 0}
+
+    def count(*_):
+        counter["statements"] += 1
+
+    event.listen(database.get_engine(), "before_cursor_execute", count)
+    event.listen(async_database.get_async_engine().sync_engine, "before_cursor_execute", count)
+
+    results = [
+        measure("sync sequential", _sync_sequential, args.top_n, args.repeat, args.warmup, counter),
+        measure("sync snapshot", _sync_snapshot, args.top_n, args.repeat, args.warmup, counter),
+        measure("async gather", _async_gather, args.top_n, args.repeat, args.warmup, counter),
+    ]
+
+    print(f"{'path':<18}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'statements':>12}")
+    for result in results:
+        print(f"{result['path']:<18}{result['mean_ms']:>10.2f}{result['p50_ms']:>10.2f}"
+              f"{result['p95_ms']:>10.2f}{result['statements_per_load']:>12.1f}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"backend": database.engine.dialect.name, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
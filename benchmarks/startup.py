@@ -0,0 +1,138 @@
+# benchmarks/startup.py
+# Measures cold starts: for each navigation page, a fresh Python process renders app.py once with that page selected
+# (the first run a new container serves) and then reruns it once (a warm rerun), reporting
+#
+#   first ms     the first render, including importing the page's modules and creating the engine if it is used
+#   rerun ms     the second render of the same page
+#   modules      modules imported by the first render
+#   engine       whether the database engine was created; connections is the number it opened
+#
+# Each run gets a throwaway SQLite database unless --configured is given. Save results with --json and pass an earlier
+# file to --compare:
+#   python benchmarks/startup.py --repeat 5 --json startup.json
+#   python benchmarks/startup.py --compare startup.json
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PAGES = [
+    "Home", "Schedule Game", "Submit Scores", "Submit Half Scores", "Non-Game Rules", "Leave Location",
+    "Token Management", "Available Games", "Past Games", "Stats", "Rules", "Admin Panel",
+]
+
+
+def _render(page):
+    """
+    Runs in the child process: renders the page twice and prints the measurements as JSON.
+    """
+    import streamlit  # noqa: F401  (the platform has Streamlit loaded before the app script runs)
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60)
+    at.session_state["page"] = page
+    modules_before = set(sys.modules)
+    start = time.perf_counter()
+    at.run()
+    first_ms = (time.perf_counter() - start) * 1000
+    modules = len(set(sys.modules) - modules_before)
+    start = time.perf_counter()
+    at.run()
+    rerun_ms = (time.perf_counter() - start) * 1000
+
+    database = sys.modules.get("database")
+    lazy = getattr(database, "_LazyEngine", None)
+    engine_created = database is not None and not (lazy and isinstance(database.engine, lazy))
+    connections = 0
+    if engine_created:
+        pool = database.engine.pool
+        connections = pool.checkedin() + pool.checkedout() if hasattr(pool, "checkedin") else 1
+    print(json.dumps({
+        "page": page,
+        "first_ms": first_ms,
+        "rerun_ms": rerun_ms,
+        "modules": modules,
+        "engine": engine_created,
+        "connections": connections,
+        "error": at.exception[0].value if at.exception else None,
+    }))
+
+
+def measure(page, repeat, configured):
+    env = dict(os.environ)
+    runs = []
+    for _ in range(repeat):
+        if not configured:
+            env["GAME_DB_BACKEND"] = "sqlite"
+            env["GAME_SQLITE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="startup-"), "startup.db")
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", page],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        "page": page,
+        "first_ms": statistics.median(run["first_ms"] for run in runs),
+        "rerun_ms": statistics.median(run["rerun_ms"] for run in runs),
+        "modules": runs[-1]["modules"],
+        "engine": runs[-1]["engine"],
+        "connections": runs[-1]["connections"],
+        "error": runs[-1]["error"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start render times of each page.")
+    parser.add_argument("pages", nargs="*", metavar="PAGE", help="pages to measure (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per page; the median is reported")
+    parser.add_argument("--configured", action="store_true", help="use the configured database instead of SQLite")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="an earlier --json file to compare first-render times against")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        _render(args.child)
+        return
+    unknown = [page for page in args.pages if page not in PAGES]
+    if unknown:
+        parser.error(f"unknown page {', '.join(unknown)}; choose from {', '.join(PAGES)}")
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {result["page"]: result for result in json.load(f)["results"]}
+
+    print(f"{'page':<20}{'first ms':>10}{'rerun ms':>10}{'modules':>9}{'engine':>8}{'conns':>7}"
+          + (f"{'first vs base':>15}" if baseline else ""))
+    results = []
+    for page in args.pages or PAGES:
+        result = measure(page, args.repeat, args.configured)
+        results.append(result)
+        line = (f"{page:<20}{result['first_ms']:>10.0f}{result['rerun_ms']:>10.0f}{result['modules']:>9}"
+                f"{'yes' if result['engine'] else 'no':>8}{result['connections']:>7}")
+        if page in baseline and baseline[page]["first_ms"]:
+            line += f"{(result['first_ms'] / baseline[page]['first_ms'] - 1) * 100:>+14.0f}%"
+        if result["error"]:
+            line += f"  error: {result['error']}"
+        print(line)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": sys.version.split()[0],
+                "repeat": args.repeat,
+                "results": results,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+# benchmarks/tournament.py
+# Plays synthetic tournaments against a throwaway embedded SQLite database and times each step of running an event:
+#
+#   schedule     get_all_teams() + get_team_match_history() + game_logic.schedule_round() for one round
+#   handicaps    game_logic.calculate_handicaps() for every team in the round
+#   insert       database.insert_scheduled_matches() for the round
+#   submit       database.submit_match_result() for one match
+#   leaderboard  database.get_leaderboard() after each round
+#
+# Every Multi Play sport in games_data.games gets stations until a round holds --round-size matches. For each team
+# count the report gives ops/sec, database statements per operation and p50/p95/p99 latency; save it with --json and
+# pass an earlier file to --compare to see what changed:
+#   python benchmarks/tournament.py --teams 10 100 1000 10000 --results 2000 --json tournament.json
+#   python benchmarks/tournament.py --compare tournament.json
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The harness never touches the configured database: each run gets its own SQLite file.
+_workdir = tempfile.mkdtemp(prefix="tournament-")
+os.environ["GAME_DB_BACKEND"] = "sqlite"
+os.environ["GAME_SQLITE_PATH"] = os.path.join(_workdir, "import.db")
+
+from sqlalchemy import event, text
+
+import cache
+import database
+import notifications
+import storage
+from game_logic import calculate_handicaps, schedule_round
+from games_data import games
+
+OPERATIONS = ["schedule", "handicaps", "insert", "submit", "leaderboard"]
+SPORTS = [name for name, info in games.items() if info["type"] == "Multi Play"]
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class Recorder:
+    """
+    Collects latency samples and statement counts per operation.
+    """
+
+    def __init__(self, engine):
+        self.samples = {name: [] for name in OPERATIONS}
+        self.statements = {name: 0 for name in OPERATIONS}
+        self._statements = 0
+        event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, *_):
+        self._statements += 1
+
+    def time(self, name, fn, *args):
+        self._statements = 0
+        start = time.perf_counter()
+        result = fn(*args)
+        self.samples[name].append((time.perf_counter() - start) * 1000)
+        self.statements[name] += self._statements
+        return result
+
+    def report(self):
+        report = []
+        for name in OPERATIONS:
+            samples = sorted(self.samples[name])
+            if not samples:
+                continue
+            total_ms = sum(samples)
+            report.append({
+                "operation": name,
+                "count": len(samples),
+                "ops_per_sec": len(samples) / (total_ms / 1000) if total_ms else None,
+                "statements_per_op": self.statements[name] / len(samples),
+                "p50_ms": _percentile(samples, 0.50),
+                "p95_ms": _percentile(samples, 0.95),
+                "p99_ms": _percentile(samples, 0.99),
+                "max_ms": samples[-1],
+            })
+        return report
+
+
+def _seed_teams(engine, team_count, rng):
+    with engine.begin() as conn:
+        conn.execute(
+            text('INSERT INTO public."Teams" (team_name, "Score", "Games_played") VALUES (:team_name, 0, 0)'),
+            [{"team_name": f"Team {i:05d}"} for i in range(1, team_count + 1)]
+        )
+        # A few teams start with a Comeback token so the double-points path is exercised too.
+        conn.execute(
+            text('INSERT INTO public."TeamTokens" (team_id, token_name, count) VALUES (:team_id, \'Comeback\', 1)'),
+            [{"team_id": team_id} for team_id in range(1, team_count + 1) if rng.random() < 0.1]
+        )
+
+
+def _random_score(rng):
+    """
+    Returns a (team1_score, team2_score) pair; about a third of the games are close enough to count as overtime.
+    """
+    winner = 11
+    loser = rng.randint(9, 10) if rng.random() < 0.33 else rng.randint(0, 8)
+    return (winner, loser) if rng.random() < 0.5 else (loser, winner)
+
+
+def _schedule(round_size):
+    teams = database.get_all_teams()
+    history = database.get_team_match_history()
+    matches = min(round_size, len(teams) // 2)
+    venues = [SPORTS[i % len(SPORTS)] for i in range(matches)]
+    return schedule_round(venues, teams, history["last_opponents"], history["sport_counts"])
+
+
+def run_tournament(team_count, results, round_size, seed):
+    """
+    Plays rounds against a fresh database until `results` matches have been submitted.
+    """
+    rng = random.Random(seed)
+    path = os.path.join(_workdir, f"tournament-{team_count}.db")
+    database.engine = notifications.install(storage.create_sqlite_engine(path))
+    # Cached reads from the previous team count belong to another database.
+    cache.clear()
+    _seed_teams(database.engine, team_count, rng)
+    recorder = Recorder(database.engine)
+
+    submitted = 0
+    rounds = 0
+    start = time.perf_counter()
+    while submitted < results:
+        pairings = recorder.time("schedule", _schedule, round_size)
+        pairings = pairings[:results - submitted]
+        pairs = [(team, sport) for sport, team1, team2 in pairings for team in (team1, team2)]
+        handicaps = recorder.time("handicaps", calculate_handicaps, pairs)
+        match_ids = recorder.time("insert", database.insert_scheduled_matches, [
+            {
+                "sport": sport,
+                "team1_id": team1["id"],
+                "team2_id": team2["id"],
+                "handicap1": handicaps[2 * i],
+                "handicap2": handicaps[2 * i + 1],
+            }
+            for i, (sport, team1, team2) in enumerate(pairings)
+        ])
+        for match_id in match_ids:
+            recorder.time("submit", database.submit_match_result, match_id, *_random_score(rng))
+        recorder.time("leaderboard", database.get_leaderboard)
+        submitted += len(match_ids)
+        rounds += 1
+    elapsed = time.perf_counter() - start
+    database.engine.dispose()
+
+    return {
+        "teams": team_count,
+        "results": submitted,
+        "rounds": rounds,
+        "elapsed_s": elapsed,
+        "results_per_sec": submitted / elapsed,
+        "operations": recorder.report(),
+    }
+
+
+def _print_run(run, baseline=None):
+    print(f"\n{run['teams']} teams: {run['results']} results in {run['rounds']} rounds, "
+          f"{run['elapsed_s']:.2f}s ({run['results_per_sec']:.0f} results/s)")
+    before = {op["operation"]: op for op in (baseline or {}).get("operations", [])}
+    print(f"{'operation':<13}{'count':>7}{'ops/s':>10}{'stmts/op':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          + (f"{'p50 vs base':>13}" if baseline else ""))
+    for op in run["operations"]:
+        line = (f"{op['operation']:<13}{op['count']:>7}{op['ops_per_sec'] or 0:>10.0f}{op['statements_per_op']:>10.1f}"
+                f"{op['p50_ms']:>9.2f}{op['p95_ms']:>9.2f}{op['p99_ms']:>9.2f}")
+        if op["operation"] in before and before[op["operation"]]["p50_ms"]:
+            line += f"{(op['p50_ms'] / before[op['operation']]['p50_ms'] - 1) * 100:>+12.0f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scheduling, handicaps and scoring on synthetic tournaments.")
+    parser.add_argument("--teams", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--results", type=int, default=2000, help="match results to submit per team count")
+    parser.add_argument("--round-size", type=int, default=50, help="matches per scheduled round")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="an earlier --json file to compare p50 latencies against")
+    args = parser.parse_args(argv)
+
+    baselines = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baselines = {run["teams"]: run for run in json.load(f)["runs"]}
+
+    runs = []
+    for team_count in args.teams:
+        run = run_tournament(team_count, args.results, args.round_size, args.seed)
+        _print_run(run, baselines.get(team_count))
+        runs.append(run)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "seed": args.seed,
+                "round_size": args.round_size,
+                "runs": runs,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# cache.py
+# A process-wide cache for the read functions in database.py, shared by every session and rerun.
+#
+# An entry is keyed by the function, its arguments and the version of each table the function reads (see
+# notifications.py). Any write to one of those tables changes the key, so the next call reads the database again;
+# until then every rerun and session gets the same result without a query. Values are stored pickled, so each
+# caller gets its own copy and may modify it freely.
+#
+#   GAME_CACHE_BACKEND=memory  (default) an LRU cache of GAME_CACHE_SIZE entries (default 2000) in each process
+#   GAME_CACHE_BACKEND=file    a SQLite file at GAME_CACHE_PATH shared by several app processes on one host, e.g. behind
+#                              a load balancer; the table versions live in the same file, so a write in one process
+#                              invalidates the entry for all of them
+#   GAME_CACHE_BACKEND=off     no caching
+#
+# Writes made by processes that do not bump versions (e.g. SQL run by hand, or a CLI tool on the SQLite backend with
+# the memory cache) are not noticed; set GAME_CACHE_TTL (seconds) to also re-read entries older than that.
+# Writes from other app processes are missed the same way while the change listener is configured but disconnected
+# (see notifications.listener_status()); meanwhile entries older than GAME_CACHE_DISCONNECTED_TTL (default 5) are
+# re-read.
+# Hit and miss counts per function are shown in the Admin Panel's Performance section.
+
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import notifications
+
+BACKEND = os.environ.get("GAME_CACHE_BACKEND", "memory").lower()
+SIZE = int(os.environ.get("GAME_CACHE_SIZE", "2000"))
+PATH = os.environ.get("GAME_CACHE_PATH", os.path.join(tempfile.gettempdir(), "game-cache.db"))
+TTL = float(os.environ["GAME_CACHE_TTL"]) if os.environ.get("GAME_CACHE_TTL") else None
+DISCONNECTED_TTL = float(os.environ.get("GAME_CACHE_DISCONNECTED_TTL", "5"))
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+class MemoryBackend:
+    """
+    Keeps entries in this process, evicting the least recently used beyond `size`.
+    Table versions come straight from notifications.py.
+    """
+    name = "memory"
+
+    def __init__(self, size: int = SIZE):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def version(self, tables: tuple):
+        return notifications.version(*tables)
+
+    def get(self, key: str):
+        """
+        Returns (value, stored_at) or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: bytes):
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class FileBackend:
+    """
+    Keeps entries and table versions in a SQLite file shared by every process that opens the same path.
+    Each process bumps the shared versions for the changes it sees, so the entries stay valid for all of them.
+    """
+    name = "file"
+
+    def __init__(self, path: str = PATH, size: int = SIZE):
+        self.path = path
+        self.size = size
+        self._sets = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, stored_at REAL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS versions (name TEXT PRIMARY KEY, version INTEGER NOT NULL)")
+        # Entries written before this process started may predate writes nobody was watching for.
+        self.bump(None)
+        notifications.subscribe(self.bump)
+
+    def version(self, tables: tuple):
+        names = list(tables) + ["*"]
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT COALESCE(SUM(version), 0) FROM versions WHERE name IN ({', '.join('?' * len(names))})", names
+            ).fetchone()
+        return row[0]
+
+    def bump(self, tables):
+        # "*" is added to every table's version, so bumping it invalidates everything.
+        names = tables or ["*"]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO versions (name, version) VALUES (?, 1) "
+                "ON CONFLICT (name) DO UPDATE SET version = version + 1",
+                [(name,) for name in names],
+            )
+
+    def get(self, key: str):
+        """
+        Returns (value, stored_at) or None.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value, stored_at FROM entries WHERE key = ?", (key,)).fetchone()
+        return tuple(row) if row else None
+
+    def set(self, key: str, value: bytes):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, stored_at) VALUES (?, ?, ?)", (key, value, time.time())
+            )
+            self._sets += 1
+            if self._sets % 100 == 0:
+                # Entries for old versions are never read again; keep only the newest `size`.
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key NOT IN (SELECT key FROM entries ORDER BY stored_at DESC LIMIT ?)",
+                    (self.size,),
+                )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def create_backend(name: str = None):
+    """
+    Creates the backend for the given name, or for GAME_CACHE_BACKEND if none is given. "off" returns None.
+    """
+    name = (name or BACKEND).lower()
+    if name == "memory":
+        return MemoryBackend()
+    if name == "file":
+        return FileBackend()
+    if name == "off":
+        return None
+    raise ValueError(f"Unknown cache backend: {name}")
+
+
+backend = create_backend()
+
+
+def cached(*tables: str):
+    """
+    Decorates a read function so its results are cached until one of `tables` changes.
+    The undecorated function stays available as `.uncached`.
+    """
+    def decorator(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            store = backend
+            if store is None:
+                return fn(*args, **kwargs)
+            notifications.listen()
+            # The version is read before the function runs, so a write committed meanwhile forces another read.
+            version = store.version(tables)
+            key = hashlib.blake2b(repr((name, args, sorted(kwargs.items()), version)).encode(), digest_size=16).hexdigest()
+            ttl = TTL
+            if notifications.listener_status() == "disconnected":
+                ttl = DISCONNECTED_TTL if TTL is None else min(TTL, DISCONNECTED_TTL)
+            entry = store.get(key)
+            if entry is not None and (ttl is None or time.time() - entry[1] < ttl):
+                _count(name, "hits")
+                return pickle.loads(entry[0])
+            _count(name, "misses")
+            result = fn(*args, **kwargs)
+            store.set(key, pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+            return result
+
+        wrapper.uncached = fn
+        return wrapper
+    return decorator
+
+
+def _count(name: str, outcome: str):
+    with _stats_lock:
+        counts = _stats.setdefault(name, {"hits": 0, "misses": 0})
+        counts[outcome] += 1
+
+
+def stats():
+    """
+    Per cached function: hits, misses and hit rate in this process, most called first.
+    """
+    with _stats_lock:
+        rows = [{"function": name, **counts} for name, counts in _stats.items()]
+    for row in rows:
+        calls = row["hits"] + row["misses"]
+        row["hit_rate"] = round(row["hits"] / calls, 3) if calls else None
+    return sorted(rows, key=lambda row: row["hits"] + row["misses"], reverse=True)
+
+
+def reset_stats():
+    """
+    Resets the hit/miss counts.
+    """
+    with _stats_lock:
+        _stats.clear()
+    return True
+
+
+def clear():
+    """
+    Drops every cached entry and resets the hit/miss counts, e.g. after pointing database.py at another database.
+    """
+    if backend is not None:
+        backend.clear()
+    return reset_stats()
@@ -0,0 +1,100 @@
+# export.py
+# Streams game history out of the database for post-event analysis.
+#
+#   python export.py                                  every exportable table to CSV in the current directory
+#   python export.py PastGames --format parquet --dir exports
+#
+# Rows are read and written chunk by chunk (see database.iter_table_chunks), so memory stays flat however long
+# the history is. Parquet output needs pyarrow. The Admin Panel offers the same exports as downloads.
+
+import argparse
+import csv
+import os
+
+from sqlalchemy import Boolean, DateTime, Float, Integer
+
+import schema
+from database import EXPORTABLE_TABLES, iter_table_chunks
+
+FORMATS = {"csv": ".csv", "parquet": ".parquet"}
+
+
+def export_table(table_name: str, path: str, file_format: str = "csv", chunk_size: int = 10000):
+    """
+    Writes one table to a CSV or Parquet file. Returns the number of rows written.
+    """
+    columns = [column.name for column in schema.metadata.tables[f"public.{table_name}"].columns]
+    chunks = iter_table_chunks(table_name, chunk_size)
+    if file_format == "csv":
+        return _write_csv(chunks, columns, path)
+    if file_format == "parquet":
+        return _write_parquet(chunks, table_name, path)
+    raise ValueError(f"Unsupported format: {file_format}")
+
+
+def _write_csv(chunks, columns: list, path: str):
+    rows = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for chunk in chunks:
+            writer.writerows(chunk)
+            rows += len(chunk)
+    return rows
+
+
+def _arrow_schema(table_name: str):
+    import pyarrow as pa
+
+    fields = []
+    for column in schema.metadata.tables[f"public.{table_name}"].columns:
+        if isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, Float):
+            arrow_type = pa.float64()
+        elif isinstance(column.type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(column.type, DateTime):
+            arrow_type = pa.timestamp("us", tz="UTC") if column.type.timezone else pa.timestamp("us")
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type))
+    return pa.schema(fields)
+
+
+def _write_parquet(chunks, table_name: str, path: str):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    arrow_schema = _arrow_schema(table_name)
+    rows = 0
+    with pq.ParquetWriter(path, arrow_schema) as writer:
+        for chunk in chunks:
+            # Each chunk becomes a row group.
+            batch = pa.Table.from_pylist(chunk).select(arrow_schema.names).cast(arrow_schema)
+            writer.write_table(batch)
+            rows += len(chunk)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export game history to CSV or Parquet.")
+    parser.add_argument("tables", nargs="*", metavar="TABLE",
+                        help=f"tables to export (default: all of {', '.join(EXPORTABLE_TABLES)})")
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--dir", default=".", help="directory to write the files to")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args(argv)
+    unknown = [table_name for table_name in args.tables if table_name not in EXPORTABLE_TABLES]
+    if unknown:
+        parser.error(f"cannot export {', '.join(unknown)}; choose from {', '.join(EXPORTABLE_TABLES)}")
+
+    os.makedirs(args.dir, exist_ok=True)
+    for table_name in args.tables or EXPORTABLE_TABLES:
+        path = os.path.join(args.dir, table_name + FORMATS[args.format])
+        rows = export_table(table_name, path, args.format, args.chunk_size)
+        print(f"Wrote {rows} rows to {path}")
+
+
+if __name__ == "__main__":
+    main()
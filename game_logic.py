@@ -1,18 +1,40 @@
 # game_logic.py
 
-from games_data import games
-from database import *
+import heapq
 
-def schedule_game(available_teams: list):
+import ratings as elo
+from database import get_handicap_inputs
+
+def schedule_game(available_teams: list, ratings: dict = None):
     """
     Schedules a match based on teams with the least 'Games_played'.
+    With ratings (team id -> rating in the sport, see ratings.py) the teams tied on the fewest games played
+    are paired by the closest ratings among them; a team alone in that tier gets the team rated closest
+    to it among those with the next fewest games.
     Returns a tuple with two teams.
     """
+    if ratings is not None:
+        return _schedule_by_rating(available_teams, ratings)
     sorted_teams = sorted(available_teams, key=lambda t: (t["Games_played"] or 0))
     if len(sorted_teams) >= 2:
         return sorted_teams[0], sorted_teams[1]
     return None
 
+def _schedule_by_rating(available_teams: list, ratings: dict):
+    """
+    The rating-aware mode of schedule_game(). Only the fewest-games tier is sorted, not every team.
+    """
+    if len(available_teams) < 2:
+        return None
+    fewest = min((t["Games_played"] or 0) for t in available_teams)
+    tier = [t for t in available_teams if (t["Games_played"] or 0) == fewest]
+    if len(tier) >= 2:
+        return elo.closest_pair(tier, ratings)
+    first = tier[0]
+    next_fewest = min((t["Games_played"] or 0) for t in available_teams if t is not first)
+    next_tier = [t for t in available_teams if t is not first and (t["Games_played"] or 0) == next_fewest]
+    return first, elo.nearest_rating(first, next_tier, ratings)
+
 def calculate_handicap(team: dict, game_type: str):
     """
     Returns the handicap for a given sport based on the team's win streak.
@@ -20,22 +42,30 @@ def calculate_handicap(team: dict, game_type: str):
     Otherwise, if win streak is n, returns the nth handicap (index n-1) from the game's definition.
     If the team is marked as King (team["king"] is True), the returned handicap is prefixed with "King/Queen".
     """
-    win_streak = get_team_win_streak(team["id"], game_type)
+    return calculate_handicaps([(team, game_type)])[0]
+
+def calculate_handicaps(pairs: list):
+    """
+    Batched calculate_handicap() for a whole round.
+    pairs is a list of (team, sport) tuples; returns the handicap lists in the same order.
+    The win streaks and handicap ladders for every pair are loaded with a single query.
+    """
+    win_streaks, ladders = get_handicap_inputs([(team["id"], sport) for team, sport in pairs])
+    return [
+        _handicap_for_streak(team, win_streaks.get((team["id"], sport), 0), ladders.get(sport))
+        for team, sport in pairs
+    ]
+
+def _handicap_for_streak(team: dict, win_streak: int, levels: list):
+    """
+    Applies the handicap rules to a known win streak and handicap ladder.
+    """
     if team.get("king"):
         if win_streak < 4:
             win_streak = win_streak + 1
-    game_info = get_game_by_name(game_type)
-    if not game_info:
+    if not levels:
         return ["No Handicap"]
 
-    # Build a list of handicap levels from the game definition.
-    levels = [
-        game_info["handicap1"],
-        game_info["handicap2"],
-        game_info["handicap3"],
-        game_info["handicap4"]
-    ]
-    
     # If win_streak is less than 1, no handicap is applied.
     if win_streak < 1:
         return ["No Handicap"]
@@ -47,4 +77,62 @@ def calculate_handicap(team: dict, game_type: str):
 
     handicap = levels[index]
     
-    return [handicap]
\ No newline at end of file
+    return [handicap]
+
+def schedule_round(venues: list, available_teams: list, last_opponents: dict = None, sport_counts: dict = None,
+                   window: int = 8, ratings: dict = None):
+    """
+    Fills every idle venue in one pass.
+    venues is a list of sport names, one entry per idle station (a sport can appear several times).
+    available_teams must only contain teams that are not currently playing.
+    last_opponents maps team id -> id of the team it played most recently; immediate rematches are avoided when possible.
+    sport_counts maps team id -> {sport: games played}; teams are steered towards the sports they have played least.
+    Teams are drawn from a priority queue keyed on Games_played, so the teams that have played least are placed first.
+    ratings maps sport -> {team id: rating} (see ratings.py); with it every team tied on Games_played with the first
+    team is considered, not just the window, and among them the opponent rated closest to the first team is chosen.
+    Returns a list of (sport, team1, team2) tuples; venues that cannot be filled are left out.
+    """
+    last_opponents = last_opponents or {}
+    sport_counts = sport_counts or {}
+    heap = [((team["Games_played"] or 0), team["id"], team) for team in available_teams]
+    heapq.heapify(heap)
+
+    matches = []
+    for sport in venues:
+        if len(heap) < 2:
+            break
+        # Only the teams at the front of the queue are considered for this venue.
+        candidates = [heapq.heappop(heap) for _ in range(min(window, len(heap)))]
+        if ratings is not None:
+            # The whole tier of the first team competes on rating.
+            while heap and heap[0][0] == candidates[0][0]:
+                candidates.append(heapq.heappop(heap))
+        sport_ratings = (ratings or {}).get(sport, {})
+
+        def sport_played(entry):
+            return sport_counts.get(entry[1], {}).get(sport, 0)
+
+        def rating_gap(entry):
+            if ratings is None:
+                return 0
+            return abs(sport_ratings.get(entry[1], elo.DEFAULT_RATING) - sport_ratings.get(first[1], elo.DEFAULT_RATING))
+
+        # The first team comes from the lowest Games_played tier, preferring teams new to this sport.
+        lowest = candidates[0][0]
+        first = min((c for c in candidates if c[0] == lowest), key=lambda c: (sport_played(c), c[1]))
+        others = [c for c in candidates if c is not first]
+        second = min(
+            others,
+            key=lambda c: (
+                last_opponents.get(first[1]) == c[1] or last_opponents.get(c[1]) == first[1],
+                c[0],
+                rating_gap(c),
+                sport_played(c),
+                c[1],
+            ),
+        )
+        matches.append((sport, first[2], second[2]))
+        for c in others:
+            if c is not second:
+                heapq.heappush(heap, c)
+    return matches
@@ -0,0 +1,188 @@
+# instrumentation.py
+# In-memory latency metrics for database statements and page reruns, shown in the Admin Panel.
+#
+# Statement timings come from SQLAlchemy engine events and are attributed to the database.py (or async_database.py)
+# function that issued them. Page timings are recorded around each rerun of a navigation page in app.py.
+# Only the most recent records are kept (GAME_METRICS_BUFFER, default 5000 of each), so memory stays bounded.
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+
+BUFFER_SIZE = int(os.environ.get("GAME_METRICS_BUFFER", "5000"))
+
+_queries = deque(maxlen=BUFFER_SIZE)
+_pages = deque(maxlen=BUFFER_SIZE)
+_local = threading.local()
+
+# Modules whose functions statements are attributed to.
+_DATA_MODULES = {"database", "async_database"}
+
+
+def install(engine):
+    """
+    Attaches the statement timing hooks to an engine. Installing twice on the same engine is a no-op.
+    """
+    # Imported here so app.py can time pages that never touch the database without loading SQLAlchemy.
+    from sqlalchemy import event
+
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration_ms = (time.perf_counter() - conn.info["query_start"].pop()) * 1000
+    rows = cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else None
+    _queries.append({
+        "at": time.time(),
+        "function": _calling_function(),
+        "statement": _normalize(statement),
+        "duration_ms": duration_ms,
+        "rows": rows,
+    })
+    page_run = getattr(_local, "page_run", None)
+    if page_run is not None:
+        page_run["statements"] += 1
+        page_run["db_ms"] += duration_ms
+
+
+def _calling_function():
+    """
+    Returns the name of the innermost database.py / async_database.py function on the stack.
+    """
+    name = _data_function(sys._getframe(2))
+    if name is None:
+        # The async engine runs the driver in a greenlet; the awaiting coroutine is on its parent's stack.
+        greenlet = sys.modules.get("greenlet")
+        parent = greenlet.getcurrent().parent if greenlet else None
+        if parent is not None:
+            name = _data_function(parent.gr_frame)
+    return name or "other"
+
+
+def _data_function(frame):
+    while frame is not None:
+        name = frame.f_code.co_name
+        if frame.f_globals.get("__name__") in _DATA_MODULES and not name.startswith(("_", "<")):
+            return f"{frame.f_globals['__name__']}.{name}"
+        frame = frame.f_back
+    return None
+
+
+def _normalize(statement: str):
+    return re.sub(r"\s+", " ", statement).strip()[:300]
+
+
+def start_page(page: str):
+    """
+    Starts timing a rerun of a navigation page in the current thread. Pass the result to finish_page().
+    """
+    page_run = {"page": page, "started": time.perf_counter(), "statements": 0, "db_ms": 0.0}
+    _local.page_run = page_run
+    return page_run
+
+
+def finish_page(page_run: dict):
+    """
+    Records a page rerun started with start_page().
+    """
+    _local.page_run = None
+    _pages.append({
+        "at": time.time(),
+        "page": page_run["page"],
+        "duration_ms": (time.perf_counter() - page_run["started"]) * 1000,
+        "statements": page_run["statements"],
+        "db_ms": page_run["db_ms"],
+    })
+
+
+def _percentile(ordered: list, fraction: float):
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _summarize(records: list, key: str, extra=None):
+    groups = {}
+    for record in records:
+        groups.setdefault(record[key], []).append(record)
+    summary = []
+    for name, group in groups.items():
+        durations = sorted(record["duration_ms"] for record in group)
+        row = {
+            key: name,
+            "count": len(group),
+            "total_ms": round(sum(durations), 2),
+            "p50_ms": round(_percentile(durations, 0.50), 2),
+            "p95_ms": round(_percentile(durations, 0.95), 2),
+            "p99_ms": round(_percentile(durations, 0.99), 2),
+        }
+        if extra:
+            row.update(extra(group))
+        summary.append(row)
+    return sorted(summary, key=lambda row: row["total_ms"], reverse=True)
+
+
+def _rows_returned(group: list):
+    # Drivers that do not report a row count for SELECTs (sqlite3) leave rows empty.
+    rows = [record["rows"] for record in group if record["rows"] is not None]
+    return {"rows": sum(rows) if rows else None}
+
+
+def summarize_functions():
+    """
+    Per calling function: statement count, total and p50/p95/p99 latency and rows, slowest total first.
+    """
+    return _summarize(list(_queries), "function", _rows_returned)
+
+
+def summarize_statements():
+    """
+    Per distinct statement: count, total and p50/p95/p99 latency and rows, slowest total first.
+    """
+    return _summarize(list(_queries), "statement", _rows_returned)
+
+
+def summarize_pages():
+    """
+    Per navigation page: rerun count, total and p50/p95/p99 rerun time and average statements per rerun.
+    A high statement count per rerun usually means an N+1 query pattern.
+    """
+    def statements(group):
+        return {
+            "statements_per_rerun": round(sum(record["statements"] for record in group) / len(group), 1),
+            "db_ms_per_rerun": round(sum(record["db_ms"] for record in group) / len(group), 2),
+        }
+    return _summarize(list(_pages), "page", statements)
+
+
+def export_json():
+    """
+    Returns the summaries and the raw buffered records as a JSON string.
+    """
+    return json.dumps({
+        "exported_at": time.time(),
+        "functions": summarize_functions(),
+        "statements": summarize_statements(),
+        "pages": summarize_pages(),
+        "queries": list(_queries),
+        "page_runs": list(_pages),
+    }, indent=2)
+
+
+def reset():
+    """
+    Discards every buffered record.
+    """
+    _queries.clear()
+    _pages.clear()
+    return True
@@ -0,0 +1,71 @@
+# ledger.py
+# Command-line maintenance for the ScoreLedger table.
+#
+#   python ledger.py open                 record opening balances for scores earned before the ledger existed
+#   python ledger.py rebuild              recompute every team's score by replaying the whole ledger
+#   python ledger.py reprice Pool 30      change a sport's point value for past results and rebuild
+#   python ledger.py history [TEAM_ID]    print the ledger, optionally for one team
+#   python ledger.py replay [--points Pool=30 ...]
+#                                         re-score PastGames in memory and compare with the current scores
+
+import argparse
+import time
+
+from database import (
+    get_all_games, get_all_teams, get_score_events, open_score_ledger, rebuild_team_scores, replay_past_games,
+    reprice_score_events,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the ScoreLedger and the team scores derived from it.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("open", help="record opening balances for scores not yet in the ledger")
+    commands.add_parser("rebuild", help="recompute team scores from the ledger")
+    reprice = commands.add_parser("reprice", help="rescale past results of a sport to a new point value")
+    reprice.add_argument("sport")
+    reprice.add_argument("points", type=int)
+    history = commands.add_parser("history", help="print ledger entries")
+    history.add_argument("team_id", type=int, nargs="?")
+    replay = commands.add_parser("replay", help="re-score PastGames in memory and compare with current scores")
+    replay.add_argument("--points", action="append", default=[], metavar="SPORT=POINTS",
+                        help="score a sport at a different point value (repeatable)")
+    args = parser.parse_args(argv)
+
+    if args.command == "open":
+        print(f"Recorded {open_score_ledger()} opening balance entries.")
+    elif args.command == "rebuild":
+        rebuild_team_scores()
+        print("Team scores rebuilt from the ledger.")
+    elif args.command == "reprice":
+        changed = reprice_score_events(args.sport, args.points)
+        print(f"Repriced {changed} {args.sport} entries to {args.points} points and rebuilt team scores.")
+    elif args.command == "history":
+        for event in get_score_events(args.team_id):
+            print(f"{event['created_at']}  team {event['team_id']:>4}  {event['kind']:<16} {event['points']:>+6g}  "
+                  f"{event['sport'] or ''} {event['reference'] or ''}".rstrip())
+    elif args.command == "replay":
+        games = {game["name"]: dict(game) for game in get_all_games()}
+        for override in args.points:
+            sport, _, points = override.rpartition("=")
+            if not sport:
+                parser.error(f"--points {override}: expected SPORT=POINTS")
+            if sport not in games:
+                parser.error(f"--points {override}: unknown sport {sport!r}; expected one of {', '.join(sorted(games))}")
+            if not points.lstrip("-").isdigit():
+                parser.error(f"--points {override}: POINTS must be a whole number")
+            games[sport]["points"] = int(points)
+        start = time.perf_counter()
+        state, skipped = replay_past_games(games)
+        elapsed = time.perf_counter() - start
+        current = {team["id"]: team["Score"] or 0 for team in get_all_teams()}
+        print(f"{'team':<24}{'current':>9}{'replayed':>10}{'change':>8}")
+        for team in sorted(state.values(), key=lambda team: team.score, reverse=True):
+            change = team.score - current.get(team.id, 0)
+            print(f"{team.team_name:<24}{current.get(team.id, 0):>9g}{team.score:>10g}{change:>+8g}")
+        print(f"Replayed in {elapsed:.3f}s; {skipped} games skipped. Replayed scores only cover games, "
+              f"not rule breaks or admin overrides.")
+
+
+if __name__ == "__main__":
+    main()
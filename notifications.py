@@ -0,0 +1,224 @@
+# notifications.py
+# Per-table change versions, so sessions can reuse data read by another session until one of its tables changes.
+#
+# install(engine) watches the statements an engine runs. When a transaction that wrote to a table commits, the
+# table's version is bumped as soon as its connection goes back to the pool; a rolled back transaction bumps nothing.
+# Within one process that is all that is needed (tests, the SQLite backend, a single app node).
+#
+# On Postgres every such commit also sends NOTIFY game_changes with the table names, and listen() starts one
+# LISTEN connection per process that bumps the same versions, so writes made by other app processes are seen too.
+# While that connection is down, writes from other processes are missed; listener_status() reports it and the first
+# failure of each outage is logged.
+
+import logging
+import re
+import select
+import threading
+import time
+import uuid
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import NullPool
+
+CHANNEL = "game_changes"
+# Seconds between reconnect attempts of the listener after its connection drops.
+RECONNECT_DELAY = 5
+
+# Marks this process's own notifications, which have already been applied locally.
+_ORIGIN = uuid.uuid4().hex
+_versions = {}
+# Raised by bump_all() and added to every table's version.
+_epoch = 0
+_total = 0
+_changed = threading.Condition()
+_subscribers = []
+_listen_url = None
+_listener = None
+_connected = False
+
+logger = logging.getLogger(__name__)
+
+_WRITE_TARGET = re.compile(
+    r'^\s*(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?)\s+(?:"?public"?\.)?"?(\w+)"?', re.IGNORECASE
+)
+
+
+def version(*tables: str):
+    """
+    Returns a number that changes whenever one of the given tables changes, or whenever any table changes
+    if none are given. Compare it with an earlier value to tell whether data read in between is stale.
+    """
+    with _changed:
+        if not tables:
+            return _total
+        return _epoch + sum(_versions.get(table, 0) for table in tables)
+
+
+def bump(*tables: str):
+    """
+    Records that the given tables changed and wakes up anything waiting in wait_for_change().
+    """
+    global _total
+    if not tables:
+        return
+    with _changed:
+        for table in tables:
+            _versions[table] = _versions.get(table, 0) + 1
+        _total += 1
+        _changed.notify_all()
+    for callback in _subscribers:
+        callback(tables)
+
+
+def bump_all():
+    """
+    Records that any table may have changed, e.g. after notifications could have been missed.
+    """
+    global _epoch, _total
+    with _changed:
+        _epoch += 1
+        _total += 1
+        _changed.notify_all()
+    for callback in _subscribers:
+        callback(None)
+
+
+def subscribe(callback):
+    """
+    Calls callback(tables) after every bump, with None when any table may have changed.
+    """
+    _subscribers.append(callback)
+
+
+def wait_for_change(since: int, timeout: float = None):
+    """
+    Blocks until version() is no longer `since` or the timeout passes. Returns the current version().
+    """
+    with _changed:
+        _changed.wait_for(lambda: _total != since, timeout)
+        return _total
+
+
+@lru_cache(maxsize=1024)
+def _written_table(statement: str):
+    match = _WRITE_TARGET.match(statement)
+    return match.group(1) if match else None
+
+
+def install(engine, listen_url: str = None):
+    """
+    Makes commits on an engine bump the versions of the tables they wrote to (and NOTIFY other processes
+    on Postgres). listen_url is the Postgres database listen() will LISTEN on.
+    Installing twice on the same engine is a no-op.
+    """
+    global _listen_url
+    if listen_url:
+        _listen_url = listen_url
+    if event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        return engine
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "commit", _commit)
+    event.listen(engine, "rollback", _rollback)
+    event.listen(engine, "checkin", _checkin)
+    return engine
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    table = _written_table(statement)
+    if table is not None:
+        conn.info.setdefault("written_tables", set()).add(table)
+
+
+def _commit(conn):
+    # Fires before the commit reaches the database, so the local bump waits until the connection is checked in.
+    tables = conn.info.pop("written_tables", None)
+    if not tables:
+        return
+    conn.info.setdefault("committed_tables", set()).update(tables)
+    if conn.dialect.name == "postgresql":
+        # Sent inside the transaction, so Postgres delivers it only if the commit succeeds.
+        with conn.connection.dbapi_connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", (CHANNEL, _ORIGIN + ":" + ",".join(sorted(tables))))
+
+
+def _rollback(conn):
+    conn.info.pop("written_tables", None)
+
+
+def _checkin(dbapi_connection, connection_record):
+    if connection_record is None:
+        return
+    tables = connection_record.info.pop("committed_tables", None)
+    if tables:
+        bump(*tables)
+
+
+def listen():
+    """
+    Starts this process's LISTEN connection to the listen_url given to install(), once, so versions also follow
+    writes made by other processes. Call it before relying on versions; does nothing without a listen_url.
+    """
+    if _listener is None and _listen_url:
+        start_listener(_listen_url)
+
+
+def start_listener(url: str):
+    """
+    Starts this process's LISTEN connection to the Postgres database at `url`, once. It has to be a session
+    connection (not a transaction-mode pooler). Returns the listener thread.
+    """
+    global _listener
+    with _changed:
+        if _listener is None:
+            _listener = threading.Thread(target=_listen, args=(url,), name="game-changes-listener", daemon=True)
+            _listener.start()
+        return _listener
+
+
+def listener_status():
+    """
+    Returns "off" if there is no listen_url (only this process's own writes are followed), "connected" while the
+    LISTEN connection is up, and "disconnected" before it first connects or while it is reconnecting.
+    """
+    if not _listen_url:
+        return "off"
+    return "connected" if _connected else "disconnected"
+
+
+def _listen(url: str):
+    global _connected
+    engine = create_engine(url, poolclass=NullPool)
+    failing = False
+    while True:
+        conn = None
+        try:
+            conn = engine.raw_connection()
+            dbapi_connection = conn.dbapi_connection
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+            _connected = True
+            if failing:
+                logger.info("Change listener reconnected")
+                failing = False
+            # Anything may have changed while the listener was not connected.
+            bump_all()
+            while True:
+                if select.select([dbapi_connection], [], [], 60) == ([], [], []):
+                    continue
+                dbapi_connection.poll()
+                while dbapi_connection.notifies:
+                    origin, _, tables = dbapi_connection.notifies.pop(0).payload.partition(":")
+                    if origin != _ORIGIN:
+                        bump(*tables.split(","))
+        except Exception:
+            _connected = False
+            if not failing:
+                # Logged once per outage; the retries every RECONNECT_DELAY seconds stay quiet until it reconnects.
+                logger.warning("Change listener disconnected, retrying every %s seconds", RECONNECT_DELAY,
+                               exc_info=True)
+                failing = True
+            if conn is not None:
+                conn.invalidate()
+            time.sleep(RECONNECT_DELAY)
@@ -0,0 +1,187 @@
+# projection.py
+# Monte Carlo projection of the final standings, for "who can still become King?".
+#
+# Every simulation plays out the rest of the event from the current Teams scores:
+#   - each scheduled Multi Play match or Duel between two teams, won by either side with a probability worked out
+#     from both teams' PastGames records in that sport (see win_probability),
+#   - and the games each team still needs to reach games_per_team, each against an average opponent in a random
+#     Multi Play sport.
+# A Multi Play win earns the game's points and a Duel moves scoring.DUEL_POINTS from the loser to the winner;
+# Comeback doubling and tokens are not simulated. All simulations are sampled at once as NumPy arrays, CHUNK at a
+# time to bound memory, so there is no Python loop per simulation or per game. A team's expected games are alike,
+# so the exact distribution of the points they add up to is worked out once (expected_points_distribution) and
+# each simulation draws from it with a single lookup.
+#
+# project_standings() is cached per version of the tables it reads (see cache.py), so the Home page only pays for
+# a projection after a result, a schedule change or a score change.
+
+import os
+
+import numpy as np
+
+import analytics
+import cache
+from database import get_all_games, get_all_teams, get_scheduled_matches
+from scoring import DUEL_POINTS
+
+SIMULATIONS = int(os.environ.get("GAME_PROJECTION_SIMULATIONS", "100000"))
+# Simulations sampled together; bounds the arrays to CHUNK x games.
+CHUNK = 10000
+# Steps of the lookup tables expected points are drawn from; each step is a probability of 1 / QUANTILES,
+# far below the sampling error of the simulations.
+QUANTILES = 2 ** 14
+# A team's record counts as PRIOR_GAMES extra games at its overall win rate in a sport, and its overall rate starts
+# from one win and one loss, so a team with little history is treated as close to average.
+PRIOR_GAMES = 2
+
+
+def win_probability(rate: np.ndarray, opponent_rate: np.ndarray):
+    """
+    The chance that a team beating an average opponent with probability `rate` beats one with `opponent_rate`
+    (the log5 formula). Works element-wise on arrays.
+    """
+    return rate * (1 - opponent_rate) / (rate * (1 - opponent_rate) + opponent_rate * (1 - rate))
+
+
+def team_win_rates(teams: list, stats: analytics.PastGamesStats, sports: list):
+    """
+    Returns a len(teams) x len(sports) array with each team's chance of beating an average opponent in each sport,
+    from its PastGames record in the sport shrunk towards its record over every sport.
+    """
+    names = [team["team_name"] for team in teams]
+    overall = stats.totals.groupby(level="team")[["wins", "games"]].sum().reindex(names, fill_value=0)
+    overall_rate = ((overall["wins"] + 1) / (overall["games"] + 2)).to_numpy()
+    by_sport = stats.totals[["wins", "games"]]
+    rates = np.repeat(overall_rate[:, None], len(sports), axis=1)
+    for column, sport in enumerate(sports):
+        record = by_sport[by_sport.index.get_level_values("sport") == sport].droplevel("sport").reindex(
+            names, fill_value=0
+        )
+        rates[:, column] = (record["wins"].to_numpy() + PRIOR_GAMES * overall_rate) / (
+            record["games"].to_numpy() + PRIOR_GAMES
+        )
+    return rates
+
+
+def expected_points_distribution(rates: np.ndarray, sport_points: np.ndarray, games: int):
+    """
+    The distribution of the points a team adds in `games` games, each in a sport drawn at random from those whose
+    (whole) points are in sport_points and won with the team's chance in that sport from `rates`.
+    Returns p where p[k] is the probability of adding exactly k points.
+    """
+    one_game = np.zeros(int(sport_points.max(initial=0)) + 1)
+    np.add.at(one_game, sport_points.astype(int), rates / len(sport_points))
+    one_game[0] += 1 - one_game.sum()
+    distribution = np.ones(1)
+    for _ in range(games):
+        distribution = np.convolve(distribution, one_game)
+    return distribution
+
+
+def simulate(scores: np.ndarray, team1: np.ndarray, team2: np.ndarray, team1_wins: np.ndarray, points: np.ndarray,
+             transfers: np.ndarray, expected_points: list = None, simulations: int = SIMULATIONS, seed: int = None):
+    """
+    Plays out the rest of the event `simulations` times.
+      - scores: each team's current score
+      - team1, team2, team1_wins, points, transfers: per remaining match, the two teams' indexes, the chance that
+        team1 wins, the points at stake, and whether the loser gives the points up (a Duel)
+      - expected_points: per team, the distribution of the points its expected games add
+        (see expected_points_distribution), or None if it has none
+    Returns (p_first, p_top3, expected_score), one entry per team. Ties are broken at random.
+    """
+    n_teams = len(scores)
+    # One-hot team columns, so every simulation's score changes are one matrix product.
+    home = np.zeros((len(team1), n_teams))
+    home[np.arange(len(team1)), team1] = 1
+    away = np.zeros((len(team2), n_teams))
+    away[np.arange(len(team2)), team2] = 1
+    loser_points = np.where(transfers, -points, 0)
+    # Each playing team's inverse cumulative distribution, so a uniform draw maps to its points by indexing.
+    playing = [team for team, distribution in enumerate(expected_points or []) if distribution is not None]
+    quantiles = np.zeros((len(playing), QUANTILES), dtype=np.int32)
+    for row, team in enumerate(playing):
+        cdf = np.cumsum(expected_points[team])
+        steps = np.searchsorted(cdf, (np.arange(QUANTILES) + 0.5) / QUANTILES, side="right")
+        quantiles[row] = np.minimum(steps, len(cdf) - 1)
+
+    rng = np.random.default_rng(seed)
+    first = np.zeros(n_teams)
+    top3 = np.zeros(n_teams)
+    total = np.zeros(n_teams)
+    for start in range(0, simulations, CHUNK):
+        size = min(CHUNK, simulations - start)
+        final = np.broadcast_to(scores, (size, n_teams)).astype(float)
+        if len(team1):
+            won = rng.random((size, len(team1))) < team1_wins
+            final += np.where(won, points, loser_points) @ home + np.where(won, loser_points, points) @ away
+        if playing:
+            draws = rng.integers(0, QUANTILES, size=(size, len(playing)))
+            final[:, playing] += quantiles[np.arange(len(playing)), draws]
+        total += final.sum(axis=0)
+        # Scores are whole points, so jitter below 1 only decides ties.
+        ranked = final + rng.random(final.shape) * 0.5
+        first += np.bincount(ranked.argmax(axis=1), minlength=n_teams)
+        podium = min(3, n_teams)
+        top = np.argpartition(-ranked, podium - 1, axis=1)[:, :podium]
+        top3 += np.bincount(top.ravel(), minlength=n_teams)
+    return first / simulations, top3 / simulations, total / simulations
+
+
+@cache.cached("Teams", "ScheduledMatches", "PastGames", "Games")
+def project_standings(games_per_team: int = None, simulations: int = SIMULATIONS, seed: int = 0):
+    """
+    Projects the final standings from the current scores, the scheduled matches and, if games_per_team is given,
+    the games each team still needs to play that many in total.
+    Returns one row per team, most likely King first: team_id, team_name, score, remaining (games left to
+    simulate), p_first, p_top3 and expected_score. Cached until one of the tables it reads changes.
+    """
+    teams = get_all_teams()
+    if not teams:
+        return []
+    index = {team["id"]: i for i, team in enumerate(teams)}
+    multi_play = {game["name"]: game["points"] for game in get_all_games() if game["type"] == "Multi Play"}
+    sports = list(multi_play) + ["Duel"]
+    rates = team_win_rates(teams, analytics.get_stats(), sports)
+
+    matches = [
+        match for match in get_scheduled_matches()
+        if match["team1_id"] in index and match["team2_id"] in index
+        and (match["sport"] in multi_play or match["sport"] == "Duel")
+    ]
+    team1 = np.array([index[match["team1_id"]] for match in matches], dtype=int)
+    team2 = np.array([index[match["team2_id"]] for match in matches], dtype=int)
+    column = np.array([sports.index(match["sport"]) for match in matches], dtype=int)
+    transfers = np.array([match["sport"] == "Duel" for match in matches], dtype=bool)
+    points = np.array([DUEL_POINTS if match["sport"] == "Duel" else multi_play[match["sport"]] for match in matches])
+    team1_wins = win_probability(rates[team1, column], rates[team2, column])
+
+    scheduled = np.bincount(np.concatenate([team1, team2]), minlength=len(teams))
+    # Duels do not count as games played.
+    scheduled_games = np.bincount(np.concatenate([team1[~transfers], team2[~transfers]]), minlength=len(teams))
+    played = np.array([team["Games_played"] or 0 for team in teams])
+    remaining = np.maximum((games_per_team or 0) - played - scheduled_games, 0)
+    if not multi_play:
+        remaining[:] = 0
+    sport_points = np.array(list(multi_play.values()))
+    expected_points = [
+        expected_points_distribution(rates[i, :len(multi_play)], sport_points, games) if games else None
+        for i, games in enumerate(remaining)
+    ]
+
+    p_first, p_top3, expected_score = simulate(
+        np.array([team["Score"] or 0 for team in teams], dtype=float), team1, team2, team1_wins,
+        points.astype(float), transfers, expected_points, simulations, seed,
+    )
+    rows = [
+        {
+            "team_id": team["id"],
+            "team_name": team["team_name"],
+            "score": team["Score"] or 0,
+            "remaining": int(scheduled[i] + remaining[i]),
+            "p_first": float(p_first[i]),
+            "p_top3": float(p_top3[i]),
+            "expected_score": float(expected_score[i]),
+        }
+        for i, team in enumerate(teams)
+    ]
+    return sorted(rows, key=lambda row: (-row["p_first"], -row["expected_score"], row["team_id"]))
@@ -0,0 +1,89 @@
+# ratings.py
+# Elo ratings per team and sport as pure functions, like scoring.py. database.py reads the two ratings a Multi Play
+# result touches, updates them with update() and writes them back in the result's transaction, so a result costs
+# the same however long the history is. recompute() rates a whole PastGames history from scratch instead.
+#
+# closest_pair() and nearest_rating() are the scheduler's rating-aware mode (see game_logic.py).
+
+DEFAULT_RATING = 1500.0
+# The most a single result can move a rating.
+K_FACTOR = 32
+# A team rated SCALE points above its opponent is expected to win 10 games to 1.
+SCALE = 400
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    """
+    The share of games a team rated `rating` is expected to win against `opponent_rating`, between 0 and 1.
+    """
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / SCALE))
+
+
+def update(rating1: float, rating2: float, team1_score: int, team2_score: int, k: float = K_FACTOR):
+    """
+    Returns both teams' ratings after a result. A win counts 1, a draw 0.5 and a loss 0; each team moves by k times
+    the difference between that and its expected score, so what one team gains the other loses.
+    """
+    if team1_score > team2_score:
+        actual = 1.0
+    elif team1_score < team2_score:
+        actual = 0.0
+    else:
+        actual = 0.5
+    change = k * (actual - expected_score(rating1, rating2))
+    return rating1 + change, rating2 - change
+
+
+def recompute(teams: list, past_games: list, games: dict, k: float = K_FACTOR):
+    """
+    Rates a whole game history, starting every team at DEFAULT_RATING.
+    teams is a list of team rows (id, team_name); past_games are PastGames rows oldest first;
+    games maps sport name -> {"type": ...}. Only Multi Play games between known teams are rated,
+    as they are when submitted.
+    Returns (team_id, sport) -> (rating, games rated).
+    """
+    ids = {team["team_name"]: team["id"] for team in teams}
+    rated = {}
+    for game in past_games:
+        sport = game["sport"]
+        team1_id = ids.get(game["team1"])
+        team2_id = ids.get(game["team2"])
+        if team1_id is None or team2_id is None or games.get(sport, {}).get("type") != "Multi Play":
+            continue
+        rating1, games1 = rated.get((team1_id, sport), (DEFAULT_RATING, 0))
+        rating2, games2 = rated.get((team2_id, sport), (DEFAULT_RATING, 0))
+        rating1, rating2 = update(rating1, rating2, game["team1_score"] or 0, game["team2_score"] or 0, k)
+        rated[(team1_id, sport)] = (rating1, games1 + 1)
+        rated[(team2_id, sport)] = (rating2, games2 + 1)
+    return rated
+
+
+def closest_pair(teams: list, ratings: dict):
+    """
+    Returns the two teams whose ratings are closest (ties go to the lower ids), or None for fewer than two teams.
+    ratings maps team id -> rating; unrated teams count as DEFAULT_RATING.
+    Once sorted by rating the closest pair is next to each other, so only neighbours are compared.
+    """
+    if len(teams) < 2:
+        return None
+    ranked = sorted(teams, key=lambda team: (ratings.get(team["id"], DEFAULT_RATING), team["id"]))
+    best = min(
+        range(len(ranked) - 1),
+        key=lambda i: (
+            ratings.get(ranked[i + 1]["id"], DEFAULT_RATING) - ratings.get(ranked[i]["id"], DEFAULT_RATING),
+            min(ranked[i]["id"], ranked[i + 1]["id"]),
+        ),
+    )
+    return ranked[best], ranked[best + 1]
+
+
+def nearest_rating(team: dict, candidates: list, ratings: dict):
+    """
+    Returns the candidate rated closest to `team` (ties go to the lower id), or None if there are none.
+    """
+    rating = ratings.get(team["id"], DEFAULT_RATING)
+    return min(
+        (candidate for candidate in candidates if candidate["id"] != team["id"]),
+        key=lambda candidate: (abs(ratings.get(candidate["id"], DEFAULT_RATING) - rating), candidate["id"]),
+        default=None,
+    )
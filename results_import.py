@@ -0,0 +1,67 @@
+# results_import.py
+# Bulk import of Multi Play results, e.g. kept on paper while a venue was offline.
+#
+#   python results_import.py results.csv              apply every result in one transaction
+#   python results_import.py results.json --dry-run   validate and score the batch without saving it
+#
+# CSV files need a header with match_id, team1_score and team2_score (and optionally sport);
+# JSON files hold a list of objects with the same keys. The Admin Panel imports the same files.
+
+import argparse
+import csv
+import io
+import json
+
+from database import import_match_results
+
+
+def parse_results(data: str, file_format: str):
+    """
+    Parses a CSV or JSON batch of results into the dictionaries import_match_results() expects.
+    Raises ValueError naming the first malformed row.
+    """
+    if file_format == "json":
+        rows = json.loads(data)
+        if isinstance(rows, dict):
+            rows = rows.get("results", [])
+    elif file_format == "csv":
+        rows = list(csv.DictReader(io.StringIO(data)))
+    else:
+        raise ValueError(f"Unsupported format: {file_format}")
+
+    results = []
+    for line, row in enumerate(rows, start=1):
+        try:
+            result = {
+                "match_id": int(row["match_id"]),
+                "team1_score": int(row["team1_score"]),
+                "team2_score": int(row["team2_score"]),
+            }
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"result {line}: needs integer match_id, team1_score and team2_score") from None
+        if row.get("sport"):
+            result["sport"] = str(row["sport"]).strip()
+        results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import a batch of Multi Play results in one transaction.")
+    parser.add_argument("file", help="a .csv or .json file of results")
+    parser.add_argument("--dry-run", action="store_true", help="validate and score without saving")
+    args = parser.parse_args(argv)
+
+    file_format = "json" if args.file.lower().endswith(".json") else "csv"
+    with open(args.file, encoding="utf-8") as f:
+        data = f.read()
+    try:
+        summary = import_match_results(parse_results(data, file_format), dry_run=args.dry_run)
+    except ValueError as e:
+        parser.exit(1, f"Nothing imported: {e}\n")
+    verb = "Validated" if args.dry_run else "Imported"
+    print(f"{verb} {summary['imported']} results: {summary['points_awarded']:g} points "
+          f"and {summary['tokens_awarded']} tokens awarded.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+# schema.py
+# Table definitions for the game database, the versioned migrations that add constraints and indexes to it,
+# and a bootstrap that creates and migrates it. The bootstrap runs automatically for the embedded SQLite backend.
+#
+#   python schema.py           create missing tables and apply pending migrations (needed for Postgres)
+#   python schema.py version   print the applied schema version
+#   python schema.py check     EXPLAIN the hot queries and report any that scan a table instead of using its index
+
+import json
+
+from sqlalchemy import (
+    JSON, Boolean, Column, DateTime, Float, Integer, MetaData, Table, Text, UniqueConstraint, func, inspect, select,
+    text,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+import ratings
+from games_data import games
+
+
+class utcnow(FunctionElement):
+    """
+    Server-side "current timestamp" default.
+    SQLite's CURRENT_TIMESTAMP only has second resolution, which makes ORDER BY created_at ambiguous,
+    so millisecond timestamps are used there instead.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "now()"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    return "(strftime('%Y-%m-%d %H:%M:%f', 'now'))"
+
+
+metadata = MetaData(schema="public")
+
+teams_table = Table(
+    "Teams", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("team_name", Text, nullable=False),
+    Column("Score", Float, server_default="0"),
+    Column("Games_played", Integer, server_default="0"),
+    Column("Lose_Streak", Integer, server_default="0"),
+    Column("Overtime_Games_Lost", Integer, server_default="0"),
+    Column("current_game_win_streak", Integer, server_default="0"),
+    Column("king", Boolean, server_default="0"),
+)
+
+team_tokens_table = Table(
+    "TeamTokens", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("team_id", Integer, nullable=False),
+    Column("token_name", Text, nullable=False),
+    Column("count", Integer, nullable=False, server_default="0"),
+    UniqueConstraint("team_id", "token_name"),
+)
+
+team_handicaps_table = Table(
+    "TeamHandicaps", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("team_id", Integer, nullable=False),
+    Column("sport", Text, nullable=False),
+    Column("win_streak", Integer, nullable=False, server_default="0"),
+    UniqueConstraint("team_id", "sport"),
+)
+
+scheduled_matches_table = Table(
+    "ScheduledMatches", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("sport", Text, nullable=False),
+    Column("team1_id", Integer),
+    Column("team2_id", Integer),
+    Column("handicap1", JSON),
+    Column("handicap2", JSON),
+    Column("created_at", DateTime(timezone=True), server_default=utcnow()),
+)
+
+past_games_table = Table(
+    "PastGames", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("sport", Text, nullable=False),
+    Column("team1", Text),
+    Column("team2", Text),
+    Column("team1_score", Integer),
+    Column("team2_score", Integer),
+    Column("created_at", DateTime(timezone=True), server_default=utcnow()),
+)
+
+games_table = Table(
+    "Games", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", Text, nullable=False, unique=True),
+    Column("points", Integer, nullable=False),
+    Column("type", Text, nullable=False),
+    Column("handicap1", Text),
+    Column("handicap2", Text),
+    Column("handicap3", Text),
+    Column("handicap4", Text),
+)
+
+non_game_rule_table = Table(
+    "NonGameRule", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("rule", Text, nullable=False),
+    Column("penalty", Integer, nullable=False, server_default="0"),
+    Column("updated_at", DateTime(timezone=True), server_default=utcnow()),
+)
+
+# Append-only history of every score change; Teams."Score" is the running total of these rows.
+score_ledger_table = Table(
+    "ScoreLedger", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("team_id", Integer, nullable=False),
+    Column("kind", Text, nullable=False),
+    Column("points", Float, nullable=False),
+    Column("sport", Text),
+    Column("game_points", Integer),
+    Column("reference", Text),
+    Column("created_at", DateTime(timezone=True), server_default=utcnow()),
+)
+
+# Each team's leaderboard rank when the last location was left, for showing rank changes since then.
+location_standings_table = Table(
+    "LocationStandings", metadata,
+    Column("team_id", Integer, primary_key=True, autoincrement=False),
+    Column("rank", Integer, nullable=False),
+    Column("score", Float, nullable=False),
+    Column("recorded_at", DateTime(timezone=True), server_default=utcnow()),
+)
+
+
+# Individual players and the team each one plays for, for events scored per player (e.g. Mini Golf).
+players_table = Table(
+    "Players", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", Text, nullable=False, unique=True),
+    Column("team_id", Integer, nullable=False),
+)
+
+# Each team's Elo rating per sport (see ratings.py), updated with every Multi Play result.
+team_ratings_table = Table(
+    "TeamRatings", metadata,
+    Column("team_id", Integer, primary_key=True, autoincrement=False),
+    Column("sport", Text, primary_key=True),
+    Column("rating", Float, nullable=False),
+    Column("games", Integer, nullable=False, server_default="0"),
+)
+
+# Records which migrations have been applied.
+schema_version_table = Table(
+    "SchemaVersion", metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("description", Text, nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=utcnow()),
+)
+
+
+def create_index(conn, name: str, table: str, columns: str, unique: bool = False, postgres_columns: str = None):
+    """
+    Creates an index if it does not exist yet. postgres_columns overrides the column list on Postgres
+    (e.g. to add NULLS LAST, which SQLite does not accept in an index).
+    """
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    if conn.dialect.name == "sqlite":
+        # SQLite puts the schema on the index name and already sorts NULLs last in descending order.
+        conn.execute(text(f'CREATE {kind} IF NOT EXISTS public.{name} ON "{table}" ({columns})'))
+    else:
+        conn.execute(text(f'CREATE {kind} IF NOT EXISTS {name} ON public."{table}" ({postgres_columns or columns})'))
+
+
+def _has_unique(conn, table: str, columns: list):
+    """
+    Returns True if a unique constraint or unique index covers exactly `columns`, which ON CONFLICT needs.
+    """
+    inspector = inspect(conn)
+    uniques = [c["column_names"] for c in inspector.get_unique_constraints(table, schema="public")]
+    uniques += [i["column_names"] for i in inspector.get_indexes(table, schema="public") if i["unique"]]
+    return any(sorted(unique) == sorted(columns) for unique in uniques)
+
+
+def _migration_1(conn):
+    create_index(conn, "ix_teams_score", "Teams", '"Score" DESC, id', postgres_columns='"Score" DESC NULLS LAST, id')
+    create_index(conn, "ix_scheduled_matches_created", "ScheduledMatches", "created_at, id")
+    create_index(conn, "ix_past_games_created", "PastGames", "created_at, id")
+
+
+def _migration_2(conn):
+    # Tables created before this module existed may lack the constraints the upserts in database.py rely on.
+    for name, table, columns in [
+        ("ux_team_tokens_team_token", "TeamTokens", ["team_id", "token_name"]),
+        ("ux_team_handicaps_team_sport", "TeamHandicaps", ["team_id", "sport"]),
+        ("ux_games_name", "Games", ["name"]),
+    ]:
+        if not _has_unique(conn, table, columns):
+            create_index(conn, name, table, ", ".join(columns), unique=True)
+    create_index(conn, "ix_teams_name", "Teams", "team_name")
+    create_index(conn, "ix_past_games_sport", "PastGames", "sport, created_at, id")
+    create_index(conn, "ix_past_games_team1", "PastGames", "team1")
+    create_index(conn, "ix_past_games_team2", "PastGames", "team2")
+    create_index(conn, "ix_score_ledger_team", "ScoreLedger", "team_id, id")
+    create_index(conn, "ix_score_ledger_sport", "ScoreLedger", "sport")
+    create_index(conn, "ix_non_game_rule_updated", "NonGameRule", "updated_at")
+
+
+def seed_players(conn):
+    """
+    Adds a player for every name in every team name (team names are the members' names joined by "-",
+    e.g. "Anwesh-Dane") that is not on the roster yet. Returns the number of players added.
+    """
+    known = {row.name for row in conn.execute(select(players_table.c.name))}
+    players = {}
+    for team in conn.execute(select(teams_table.c.id, teams_table.c.team_name).order_by(teams_table.c.id)):
+        for name in (team.team_name or "").split("-"):
+            name = name.strip()
+            if name and name not in known:
+                players.setdefault(name, team.id)
+    if players:
+        conn.execute(players_table.insert(), [{"name": name, "team_id": team_id} for name, team_id in players.items()])
+    return len(players)
+
+
+def _migration_3(conn):
+    create_index(conn, "ix_players_team", "Players", "team_id")
+    # Mini Golf used to find teams by the players' names in the team names; start the roster from them.
+    seed_players(conn)
+
+
+def seed_ratings(conn):
+    """
+    Replaces TeamRatings with the ratings the whole PastGames history produces (see ratings.recompute).
+    Returns the number of ratings written.
+    """
+    teams = [dict(row._mapping) for row in conn.execute(select(teams_table.c.id, teams_table.c.team_name))]
+    game_types = {row.name: {"type": row.type} for row in conn.execute(select(games_table.c.name, games_table.c.type))}
+    past_games = [
+        dict(row._mapping) for row in conn.execute(
+            select(
+                past_games_table.c.sport, past_games_table.c.team1, past_games_table.c.team2,
+                past_games_table.c.team1_score, past_games_table.c.team2_score,
+            ).order_by(past_games_table.c.created_at, past_games_table.c.id)
+        )
+    ]
+    rated = ratings.recompute(teams, past_games, game_types)
+    conn.execute(team_ratings_table.delete())
+    if rated:
+        conn.execute(team_ratings_table.insert(), [
+            {"team_id": team_id, "sport": sport, "rating": rating, "games": games_rated}
+            for (team_id, sport), (rating, games_rated) in rated.items()
+        ])
+    return len(rated)
+
+
+def _migration_4(conn):
+    team_ratings_table.create(conn, checkfirst=True)
+    create_index(conn, "ix_team_ratings_sport", "TeamRatings", "sport, rating")
+    seed_ratings(conn)
+
+
+def _migration_5(conn):
+    # Half-game points can be fractional (15 / 2 = 7.5), which Postgres rounded into the integer columns.
+    # SQLite keeps a fractional value as it is in an INTEGER column, so only Postgres needs the change.
+    if conn.dialect.name == "sqlite":
+        return
+    for table, column in [("Teams", "Score"), ("ScoreLedger", "points"), ("LocationStandings", "score")]:
+        conn.execute(text(f'ALTER TABLE public."{table}" ALTER COLUMN "{column}" TYPE double precision'))
+
+
+# Applied in order, each in its own transaction; append new migrations, never edit applied ones.
+MIGRATIONS = [
+    (1, "indexes for the leaderboard and the scheduled matches and past games pages", _migration_1),
+    (2, "unique constraints for upserts and indexes for every lookup in database.py", _migration_2),
+    (3, "player roster, seeded from team names", _migration_3),
+    (4, "team ratings per sport, computed from past games", _migration_4),
+    (5, "fractional scores and ledger points", _migration_5),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    """
+    Returns the highest applied migration, or 0 for a database that has never been migrated.
+    """
+    return conn.execute(select(func.coalesce(func.max(schema_version_table.c.version), 0))).scalar()
+
+
+def migrate(engine):
+    """
+    Applies every migration newer than the database's schema version. Returns the versions applied.
+    The tables must exist already; bootstrap_schema() creates them first.
+    """
+    applied = []
+    for version, description, apply in MIGRATIONS:
+        with engine.begin() as conn:
+            if get_schema_version(conn) >= version:
+                continue
+            apply(conn)
+            conn.execute(schema_version_table.insert().values(version=version, description=description))
+        applied.append(version)
+    return applied
+
+
+def bootstrap_schema(engine):
+    """
+    Creates any missing tables, applies pending migrations and, if the Games table is empty,
+    seeds it from games_data.games. Safe to run against a database that is already set up.
+    """
+    metadata.create_all(engine)
+    migrate(engine)
+    with engine.begin() as conn:
+        if conn.execute(select(func.count()).select_from(games_table)).scalar() == 0:
+            conn.execute(games_table.insert(), [
+                {
+                    "name": name,
+                    "points": info["points"],
+                    "type": info["type"],
+                    "handicap1": info["handicaps"][0],
+                    "handicap2": info["handicaps"][1],
+                    "handicap3": info["handicaps"][2],
+                    "handicap4": info["handicaps"][3],
+                }
+                for name, info in games.items()
+            ])
+    return True
+
+
+# The lookups the pages depend on, with the index each should use (None: any index on the table will do).
+# check_query_plans() fails a query whose plan scans one of its tables sequentially or skips its index.
+HOT_QUERIES = [
+    ("leaderboard", ["Teams"], "ix_teams_score",
+     'SELECT id FROM public."Teams" ORDER BY "Score" DESC{nulls_last}, id LIMIT 10', {}),
+    ("team by name", ["Teams"], "ix_teams_name",
+     'SELECT id FROM public."Teams" WHERE team_name = :name', {"name": "x"}),
+    ("team tokens", ["TeamTokens"], None,
+     'SELECT token_name, count FROM public."TeamTokens" WHERE team_id = :team_id', {"team_id": 1}),
+    ("team win streak", ["TeamHandicaps"], None,
+     'SELECT win_streak FROM public."TeamHandicaps" WHERE team_id = :team_id AND sport = :sport',
+     {"team_id": 1, "sport": "x"}),
+    ("game by name", ["Games"], None,
+     'SELECT * FROM public."Games" WHERE name = :name', {"name": "x"}),
+    ("scheduled matches page", ["ScheduledMatches"], "ix_scheduled_matches_created",
+     'SELECT * FROM public."ScheduledMatches" ORDER BY created_at DESC, id DESC LIMIT 20', {}),
+    ("past games page", ["PastGames"], "ix_past_games_created",
+     'SELECT * FROM public."PastGames" ORDER BY created_at DESC, id DESC LIMIT 25', {}),
+    ("past games by sport", ["PastGames"], "ix_past_games_sport",
+     'SELECT * FROM public."PastGames" WHERE sport = :sport ORDER BY created_at DESC, id DESC LIMIT 25',
+     {"sport": "x"}),
+    ("past games by team", ["PastGames"], "ix_past_games_team2",
+     'SELECT * FROM public."PastGames" WHERE team1 = :team OR team2 = :team ORDER BY created_at DESC, id DESC LIMIT 25',
+     {"team": "x"}),
+    ("ledger of a team", ["ScoreLedger"], "ix_score_ledger_team",
+     'SELECT * FROM public."ScoreLedger" WHERE team_id = :team_id ORDER BY id', {"team_id": 1}),
+    ("ledger by sport", ["ScoreLedger"], "ix_score_ledger_sport",
+     'SELECT id FROM public."ScoreLedger" WHERE sport = :sport', {"sport": "x"}),
+    ("players of a team", ["Players"], "ix_players_team",
+     'SELECT name FROM public."Players" WHERE team_id = :team_id', {"team_id": 1}),
+    ("ratings in a sport", ["TeamRatings"], "ix_team_ratings_sport",
+     'SELECT team_id, rating FROM public."TeamRatings" WHERE sport = :sport', {"sport": "x"}),
+    ("current non-game rule", ["NonGameRule"], "ix_non_game_rule_updated",
+     'SELECT rule, penalty FROM public."NonGameRule" ORDER BY updated_at DESC LIMIT 1', {}),
+]
+
+
+def _postgres_plan(conn, sql: str, params: dict):
+    plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    scans, indexes, nodes = set(), set(), [plan[0]["Plan"]]
+    lines = []
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan":
+            scans.add(node["Relation Name"])
+        if "Index Name" in node:
+            indexes.add(node["Index Name"])
+        lines.append(f'{node["Node Type"]} {node.get("Relation Name", "")} {node.get("Index Name", "")}'.strip())
+        nodes.extend(node.get("Plans", []))
+    return scans, indexes, lines
+
+
+def _sqlite_plan(conn, sql: str, params: dict):
+    lines = [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params)]
+    scans, indexes = set(), set()
+    for line in lines:
+        words = line.split()
+        if words[0] == "SCAN" and "INDEX" not in words:
+            scans.add(words[1])
+        if "INDEX" in words:
+            indexes.add(words[words.index("INDEX") + 1])
+    return scans, indexes, lines
+
+
+def check_query_plans(engine):
+    """
+    EXPLAINs every query in HOT_QUERIES against the live database.
+    Returns a list of (name, ok, plan lines). On Postgres sequential scans are disabled for the check,
+    so small tables still show whether a usable index exists.
+    """
+    results = []
+    with engine.connect() as conn:
+        sqlite = conn.dialect.name == "sqlite"
+        existing = set(inspect(conn).get_table_names(schema="public"))
+        if not sqlite:
+            conn.execute(text("SET enable_seqscan = off"))
+        for name, tables, index, sql, params in HOT_QUERIES:
+            missing = [table for table in tables if table not in existing]
+            if missing:
+                results.append((name, False, [f"missing table {table}" for table in missing]))
+                continue
+            sql = sql.format(nulls_last="" if sqlite else " NULLS LAST")
+            scans, indexes, lines = (_sqlite_plan if sqlite else _postgres_plan)(conn, sql, params)
+            ok = not (scans & set(tables)) and (index is None or index in indexes)
+            results.append((name, ok, lines))
+        if not sqlite:
+            conn.execute(text("RESET enable_seqscan"))
+    return results
+
+
+def main(argv=None):
+    import argparse
+    from storage import create_storage_engine
+
+    parser = argparse.ArgumentParser(description="Manage the schema of the configured database (see storage.py).")
+    parser.add_argument("command", nargs="?", choices=["migrate", "version", "check"], default="migrate",
+                        help="migrate (default): create missing tables and apply pending migrations; "
+                             "version: print the schema version; check: EXPLAIN the hot queries")
+    args = parser.parse_args(argv)
+
+    engine = create_storage_engine()
+    if args.command == "migrate":
+        bootstrap_schema(engine)
+        print(f"Schema is up to date (version {SCHEMA_VERSION}).")
+    elif args.command == "version":
+        with engine.connect() as conn:
+            print(f"Database schema version {get_schema_version(conn)}; latest is {SCHEMA_VERSION}.")
+    elif args.command == "check":
+        failures = 0
+        for name, ok, lines in check_query_plans(engine):
+            failures += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {name}")
+            if not ok:
+                for line in lines:
+                    print(f"       {line}")
+        if failures:
+            parser.exit(1, f"{failures} queries do not use their indexes; run `python schema.py` to migrate.\n")
+
+
+if __name__ == "__main__":
+    main()
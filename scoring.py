@@ -0,0 +1,298 @@
+# scoring.py
+# The scoring rules as pure functions: given the current state of the teams involved and a result,
+# they return a ScoreDelta describing every change the result causes. Nothing here touches the database.
+#
+# database.py loads the state, scores the result and writes the delta in one transaction;
+# apply() folds a delta into in-memory state instead, which is what replay() uses to re-score a whole
+# PastGames history, e.g. to see the standings a rule change or a new point value would have produced.
+
+from dataclasses import dataclass, field
+
+DUEL_POINTS = 5
+
+# Points per place for events scored per player; other Single Play games award their points to 1st and half to 2nd.
+PLACEMENT_POINTS = {
+    "Mini Golf": [60, 35, 20],
+}
+
+
+@dataclass(slots=True)
+class TeamState:
+    """
+    What the rules need to know about one team.
+    win_streaks maps sport -> consecutive wins; tokens maps token name -> count.
+    Only the sports and tokens a rule looks at have to be filled in.
+    """
+    id: int
+    team_name: str = None
+    score: float = 0
+    games_played: int = 0
+    lose_streak: int = 0
+    overtime_games_lost: int = 0
+    win_streaks: dict = field(default_factory=dict)
+    tokens: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ScoreDelta:
+    """
+    The changes caused by one result.
+      - score_events: ScoreLedger entries (team_id, kind, points, sport, game_points, reference)
+      - team_fields: team_id -> {"Games_played" / "Lose_Streak" / "Overtime_Games_Lost": new value}
+      - win_streaks: (team_id, sport) -> new win streak
+      - token_deltas: (team_id, token_name) -> change in count
+    """
+    sport: str
+    winner_id: int = None
+    loser_id: int = None
+    points_awarded: float = 0
+    comeback_used: bool = False
+    score_events: list = field(default_factory=list)
+    team_fields: dict = field(default_factory=dict)
+    win_streaks: dict = field(default_factory=dict)
+    token_deltas: dict = field(default_factory=dict)
+
+    def add_token(self, team_id: int, token_name: str, delta: int = 1):
+        key = (team_id, token_name)
+        self.token_deltas[key] = self.token_deltas.get(key, 0) + delta
+
+    def tokens_awarded(self):
+        """
+        Returns team_id -> {token_name: count} for the tokens this result earned.
+        """
+        awarded = {}
+        for (team_id, token_name), delta in self.token_deltas.items():
+            if delta > 0:
+                awarded.setdefault(team_id, {})[token_name] = delta
+        return awarded
+
+
+def score_match(team1: TeamState, team2: TeamState, sport: str, game_points: int,
+                team1_score: int, team2_score: int, reference: str = None) -> ScoreDelta:
+    """
+    Scores a Multi Play match.
+    Both teams get a game played. The winner earns the game's points (doubled by spending a Comeback token)
+    and extends its win streak for the sport, earning a Wizard token on its third straight win.
+    The loser's win streak resets; it earns a Duel token for every second overtime loss (losing by 2 or less),
+    a Peasant token for scoring nothing and a Comeback token for every third loss in a row.
+    A draw only counts as a game played.
+    """
+    delta = ScoreDelta(sport=sport)
+    fields1 = {"Games_played": team1.games_played + 1, "Lose_Streak": team1.lose_streak,
+               "Overtime_Games_Lost": team1.overtime_games_lost}
+    fields2 = {"Games_played": team2.games_played + 1, "Lose_Streak": team2.lose_streak,
+               "Overtime_Games_Lost": team2.overtime_games_lost}
+    delta.team_fields[team1.id] = fields1
+    delta.team_fields[team2.id] = fields2
+    if team1_score == team2_score:
+        return delta
+
+    if team1_score > team2_score:
+        winner, loser, loser_fields = team1, team2, fields2
+        margin, loser_score = team1_score - team2_score, team2_score
+    else:
+        winner, loser, loser_fields = team2, team1, fields1
+        margin, loser_score = team2_score - team1_score, team1_score
+
+    points_awarded = game_points
+    if winner.tokens.get("Comeback", 0) > 0:
+        points_awarded = 2 * game_points
+        delta.add_token(winner.id, "Comeback", -1)
+        delta.comeback_used = True
+    delta.score_events.append({
+        "team_id": winner.id, "kind": "match_win", "points": points_awarded,
+        "sport": sport, "game_points": game_points, "reference": reference,
+    })
+
+    win_streak = winner.win_streaks.get(sport, 0) + 1
+    delta.win_streaks[(winner.id, sport)] = win_streak
+    delta.win_streaks[(loser.id, sport)] = 0
+    if win_streak == 3:
+        delta.add_token(winner.id, "Wizard")
+    if margin <= 2:
+        loser_fields["Overtime_Games_Lost"] += 1
+        if loser_fields["Overtime_Games_Lost"] >= 2:
+            delta.add_token(loser.id, "Duel")
+            loser_fields["Overtime_Games_Lost"] = 0
+    if loser_score == 0:
+        delta.add_token(loser.id, "Peasant")
+    loser_fields["Lose_Streak"] += 1
+    if loser_fields["Lose_Streak"] >= 3:
+        delta.add_token(loser.id, "Comeback")
+        loser_fields["Lose_Streak"] = 0
+
+    delta.winner_id = winner.id
+    delta.loser_id = loser.id
+    delta.points_awarded = points_awarded
+    return delta
+
+
+def score_half(full_team: TeamState, half_team1: TeamState, half_team2: TeamState, sport: str,
+               game_points: int, full_team_wins: bool) -> ScoreDelta:
+    """
+    Scores a game between a full team and two half teams.
+    If the full team wins it earns the game's points and extends its win streak, earning a Wizard token on its
+    third straight win. Otherwise each half team earns half the points, and if the full team has lost three
+    or more in a row, half team 2 earns a Comeback token and its lose streak resets.
+    """
+    delta = ScoreDelta(sport=sport)
+    if full_team_wins:
+        delta.score_events.append({
+            "team_id": full_team.id, "kind": "half_score", "points": game_points,
+            "sport": sport, "game_points": game_points, "reference": "full team win",
+        })
+        win_streak = full_team.win_streaks.get(sport, 0) + 1
+        delta.win_streaks[(full_team.id, sport)] = win_streak
+        if win_streak == 3:
+            delta.add_token(full_team.id, "Wizard")
+        delta.winner_id = full_team.id
+        delta.points_awarded = game_points
+        return delta
+
+    half_points = game_points / 2
+    for team in (half_team1, half_team2):
+        delta.score_events.append({
+            "team_id": team.id, "kind": "half_score", "points": half_points,
+            "sport": sport, "game_points": game_points, "reference": "half team win",
+        })
+    if full_team.lose_streak >= 3:
+        delta.add_token(half_team2.id, "Comeback")
+        delta.team_fields[half_team2.id] = {"Lose_Streak": 0}
+    delta.points_awarded = half_points
+    return delta
+
+
+def score_single_play(first: TeamState, second: TeamState, sport: str, game_points: int) -> ScoreDelta:
+    """
+    Scores a Single Play game: first place earns the game's points and second place half of them.
+    Both teams get a game played.
+    """
+    delta = ScoreDelta(sport=sport, winner_id=first.id, loser_id=second.id, points_awarded=game_points)
+    for team, points, place in ((first, game_points, "1st place"), (second, int(0.5 * game_points), "2nd place")):
+        delta.score_events.append({
+            "team_id": team.id, "kind": "single_play", "points": points,
+            "sport": sport, "game_points": game_points, "reference": place,
+        })
+        delta.team_fields[team.id] = {"Games_played": team.games_played + 1}
+    return delta
+
+
+def place_label(place: int):
+    """
+    Returns "1st", "2nd", "3rd", "4th", ... for a 1-based place.
+    """
+    suffix = "th" if 10 <= place % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(place % 10, "th")
+    return f"{place}{suffix}"
+
+
+def score_placements(placements: list, points_table: list, sport: str) -> ScoreDelta:
+    """
+    Scores an individual event. placements lists (player name, team_id) from 1st place down and earns
+    points_table[i] for place i + 1; a team with several placed players earns each of their points.
+    """
+    if len(placements) > len(points_table):
+        raise ValueError(f"{len(placements)} placements but only {len(points_table)} places score points")
+    delta = ScoreDelta(sport=sport)
+    for place, ((player, team_id), points) in enumerate(zip(placements, points_table), start=1):
+        delta.score_events.append({
+            "team_id": team_id, "kind": "placement", "points": points,
+            "sport": sport, "reference": f"{place_label(place)} place: {player}",
+        })
+    if placements:
+        delta.winner_id = placements[0][1]
+        delta.points_awarded = points_table[0]
+    return delta
+
+
+def score_duel(winner: TeamState, loser: TeamState, points: int = DUEL_POINTS, reference: str = None) -> ScoreDelta:
+    """
+    Scores a Duel: the winner takes points from the loser.
+    """
+    delta = ScoreDelta(sport="Duel", winner_id=winner.id, loser_id=loser.id, points_awarded=points)
+    delta.score_events.append({"team_id": winner.id, "kind": "duel_transfer", "points": points,
+                               "sport": "Duel", "reference": reference})
+    delta.score_events.append({"team_id": loser.id, "kind": "duel_transfer", "points": -points,
+                               "sport": "Duel", "reference": reference})
+    return delta
+
+
+_FIELD_ATTRIBUTES = {
+    "Games_played": "games_played",
+    "Lose_Streak": "lose_streak",
+    "Overtime_Games_Lost": "overtime_games_lost",
+}
+
+
+def apply(teams: dict, delta: ScoreDelta):
+    """
+    Folds a delta into in-memory state. teams maps team_id -> TeamState and is updated in place.
+    """
+    for event in delta.score_events:
+        teams[event["team_id"]].score += event["points"]
+    for team_id, fields in delta.team_fields.items():
+        team = teams[team_id]
+        for name, value in fields.items():
+            setattr(team, _FIELD_ATTRIBUTES[name], value)
+    for (team_id, sport), win_streak in delta.win_streaks.items():
+        teams[team_id].win_streaks[sport] = win_streak
+    for (team_id, token_name), change in delta.token_deltas.items():
+        tokens = teams[team_id].tokens
+        tokens[token_name] = tokens.get(token_name, 0) + change
+    return teams
+
+
+def combine(deltas: list) -> ScoreDelta:
+    """
+    Merges the deltas of results scored one after another (each against the state the previous ones left)
+    into a single delta with the same total effect, so a batch can be written with one statement per kind of change.
+    """
+    combined = ScoreDelta(sport=None)
+    for delta in deltas:
+        combined.score_events.extend(delta.score_events)
+        for team_id, fields in delta.team_fields.items():
+            combined.team_fields.setdefault(team_id, {}).update(fields)
+        combined.win_streaks.update(delta.win_streaks)
+        for (team_id, token_name), change in delta.token_deltas.items():
+            combined.add_token(team_id, token_name, change)
+        combined.points_awarded += delta.points_awarded
+    return combined
+
+
+def replay(teams: list, past_games: list, games: dict):
+    """
+    Re-scores a whole game history in memory, starting every team from zero.
+    teams is a list of team rows (id, team_name); past_games are PastGames rows oldest first;
+    games maps sport name -> {"points": ..., "type": ...}, so changed point values apply to every past game.
+    Multi Play, Single Play and Duel games are scored; games whose teams cannot be identified
+    (e.g. Mini Golf, which records players) are skipped.
+    Returns (team_id -> TeamState, number of games skipped).
+    """
+    state = {team["id"]: TeamState(id=team["id"], team_name=team["team_name"]) for team in teams}
+    by_name = {team.team_name: team for team in state.values()}
+    skipped = 0
+    for game in past_games:
+        team1 = by_name.get(game["team1"])
+        team2 = by_name.get(game["team2"])
+        sport = game["sport"]
+        info = games.get(sport)
+        if team1 is None or team2 is None:
+            skipped += 1
+            continue
+        if sport == "Duel":
+            # team1 is the King, team2 the challenger; the winner scored 1.
+            if game["team1_score"] > game["team2_score"]:
+                delta = score_duel(team1, team2)
+            else:
+                delta = score_duel(team2, team1)
+        elif info is None:
+            skipped += 1
+            continue
+        elif info["type"] == "Multi Play":
+            delta = score_match(team1, team2, sport, info["points"], game["team1_score"] or 0, game["team2_score"] or 0)
+        elif info["type"] == "Single Play":
+            delta = score_single_play(team1, team2, sport, info["points"])
+        else:
+            skipped += 1
+            continue
+        apply(state, delta)
+    return state, skipped
@@ -0,0 +1,38 @@
+# tests/conftest.py
+# Fixtures for the tests that go through database.py: each gets a throwaway in-memory SQLite database.
+
+import pytest
+
+import cache
+import database
+import notifications
+from storage import create_sqlite_engine
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """
+    Points database.py at a new in-memory SQLite database, created and migrated like the embedded backend,
+    with an empty read cache. Yields the engine.
+    """
+    engine = notifications.install(create_sqlite_engine(":memory:"))
+    monkeypatch.setattr(database, "engine", engine)
+    # Cached reads of an earlier test's database must not be served to this one.
+    cache.clear()
+    yield engine
+    cache.clear()
+    engine.dispose()
+
+
+@pytest.fixture
+def teams(db):
+    """
+    Adds three teams with no score and returns their ids.
+    """
+    with db.begin() as conn:
+        rows = conn.execute(database.text('''
+            INSERT INTO public."Teams" (team_name, "Score", "Games_played", "Lose_Streak", "Overtime_Games_Lost", king)
+            VALUES ('Al-Bo', 0, 0, 0, 0, TRUE), ('Cy-Di', 0, 0, 0, 0, FALSE), ('Ed-Fi', 0, 0, 0, 0, FALSE)
+            RETURNING id
+        '''))
+        return [row[0] for row in rows]
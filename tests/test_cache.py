@@ -0,0 +1,83 @@
+# tests/test_cache.py
+# Cached reads are served until a write to one of their tables, including writes other processes announce.
+
+import cache
+import database
+import notifications
+
+
+def _write_unnoticed(engine, sql: str):
+    """
+    Runs a write on the DBAPI connection directly, so no table version is bumped: a stand-in for a write made
+    by another process.
+    """
+    connection = engine.raw_connection()
+    try:
+        connection.cursor().execute(sql)
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _calls(name: str):
+    counts = next((row for row in cache.stats() if row["function"] == name), {"hits": 0, "misses": 0})
+    return counts["hits"], counts["misses"]
+
+
+def test_games_catalog_follows_the_games_table(db):
+    assert database.get_game_by_name("Croquet") is None
+    database.insert_game("Croquet", 12, "Multi Play", "a", "b", "c", "d")
+    assert database.get_game_by_name("Croquet")["points"] == 12
+    assert database.get_game_handicap_ladder("Croquet") == ["a", "b", "c", "d"]
+
+
+def test_games_catalog_sees_games_added_by_another_process(db):
+    database.get_all_games()
+    _write_unnoticed(db, 'INSERT INTO public."Games" (name, points, type) VALUES (\'Croquet\', 12, \'Multi Play\')')
+    assert database.get_game_by_name("Croquet") is None
+    # What the LISTEN connection does when another process commits to Games.
+    notifications.bump("Games")
+    assert database.get_game_by_name("Croquet")["points"] == 12
+
+
+def test_roster_sees_players_added_by_another_process(db, teams):
+    database.add_player("Gus", teams[0])
+    assert database.get_roster()["team_by_player"] == {"Gus": teams[0]}
+    _write_unnoticed(db, f'INSERT INTO public."Players" (name, team_id) VALUES (\'Hal\', {teams[1]})')
+    assert "Hal" not in database.get_roster()["team_by_player"]
+    notifications.bump("Players")
+    assert database.get_roster()["team_by_player"]["Hal"] == teams[1]
+
+
+def test_reads_are_cached_until_one_of_their_tables_is_written(db, teams):
+    database.get_all_teams()
+    database.get_all_teams()
+    assert _calls("get_all_teams") == (1, 1)
+
+    # Writes to other tables and rolled back writes leave the entry valid.
+    database.insert_game("Croquet", 12, "Multi Play", "", "", "", "")
+    with db.connect() as conn:
+        conn.execute(database.text('UPDATE public."Teams" SET "Score" = 5'))
+        conn.rollback()
+    database.get_all_teams()
+    assert _calls("get_all_teams") == (2, 1)
+
+    database.record_score_event(teams[0], "admin_override", 5)
+    assert database.get_all_teams()[0]["Score"] == 5
+    assert _calls("get_all_teams") == (2, 2)
+
+
+def test_callers_get_their_own_copy(db, teams):
+    database.get_all_teams()[0]["team_name"] = "changed"
+    assert database.get_all_teams()[0]["team_name"] == "Al-Bo"
+
+
+def test_entries_expire_while_the_listener_is_disconnected(db, teams, monkeypatch):
+    database.get_all_teams()
+    database.get_all_teams()
+    assert _calls("get_all_teams") == (1, 1)
+
+    monkeypatch.setattr(notifications, "listener_status", lambda: "disconnected")
+    monkeypatch.setattr(cache, "DISCONNECTED_TTL", 0)
+    database.get_all_teams()
+    assert _calls("get_all_teams") == (1, 2)
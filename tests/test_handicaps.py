@@ -0,0 +1,23 @@
+# tests/test_handicaps.py
+# A team's handicap is the rung of the sport's ladder matching its win streak, one higher for the King.
+
+import database
+from game_logic import calculate_handicap, calculate_handicaps
+from games_data import games
+
+
+def test_handicaps_follow_win_streaks_and_the_crown(db, teams):
+    king, cy, ed = ({"id": team_id, "king": team_id == teams[0]} for team_id in teams)
+    with db.begin() as conn:
+        conn.execute(
+            database.text('''
+                INSERT INTO public."TeamHandicaps" (team_id, sport, win_streak) VALUES (:team_id, :sport, :streak)
+            '''),
+            [{"team_id": cy["id"], "sport": "Pool", "streak": 2}, {"team_id": ed["id"], "sport": "Pool", "streak": 9}]
+        )
+    ladder = games["Pool"]["handicaps"]
+
+    assert calculate_handicaps([(king, "Pool"), (cy, "Pool"), (ed, "Pool"), (cy, "Foosball"), (cy, "Croquet")]) == [
+        [ladder[0]], [ladder[1]], [ladder[3]], ["No Handicap"], ["No Handicap"],
+    ]
+    assert calculate_handicap(cy, "Pool") == [ladder[1]]
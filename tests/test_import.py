@@ -0,0 +1,74 @@
+# tests/test_import.py
+# A batch of results is applied as a whole or not at all, and each match can only be imported once.
+
+import pytest
+
+import database
+from tests.test_submit import _count, _ratings, _teams
+
+
+def _schedule(teams):
+    al, cy, ed = teams
+    return [
+        database.insert_scheduled_match("Pool", al, cy, [], []),
+        database.insert_scheduled_match("Foosball", cy, ed, [], []),
+    ]
+
+
+def test_import_applies_every_result(db, teams):
+    al, cy, ed = teams
+    first, second = _schedule(teams)
+
+    summary = database.import_match_results([
+        {"match_id": first, "team1_score": 10, "team2_score": 4},
+        {"match_id": second, "team1_score": 2, "team2_score": 10, "sport": "Foosball"},
+    ])
+
+    assert summary["imported"] == 2
+    assert _teams(db) == {al: (25, 1), cy: (0, 2), ed: (15, 1)}
+    assert _ratings(db) == {(al, "Pool"): 1, (cy, "Pool"): 1, (cy, "Foosball"): 1, (ed, "Foosball"): 1}
+    assert _count(db, "PastGames") == 2
+    assert _count(db, "ScheduledMatches") == 0
+
+
+def test_import_rejects_matches_already_submitted(db, teams):
+    first, second = _schedule(teams)
+    database.submit_match_result(first, 10, 4)
+
+    with pytest.raises(ValueError, match="not scheduled"):
+        database.import_match_results([
+            {"match_id": first, "team1_score": 10, "team2_score": 4},
+            {"match_id": second, "team1_score": 2, "team2_score": 10},
+        ])
+
+    assert _count(db, "ScheduledMatches") == 1
+    assert _count(db, "PastGames") == 1
+
+
+def test_import_changes_nothing_when_one_result_is_invalid(db, teams):
+    first, second = _schedule(teams)
+
+    with pytest.raises(ValueError, match="not Pool"):
+        database.import_match_results([
+            {"match_id": first, "team1_score": 10, "team2_score": 4},
+            {"match_id": second, "team1_score": 2, "team2_score": 10, "sport": "Pool"},
+        ])
+
+    assert _count(db, "ScheduledMatches") == 2
+    assert _count(db, "ScoreLedger") == 0
+    assert _count(db, "PastGames") == 0
+    assert all(score == (0, 0) for score in _teams(db).values())
+
+
+def test_import_dry_run_scores_without_writing(db, teams):
+    first, second = _schedule(teams)
+
+    summary = database.import_match_results([
+        {"match_id": first, "team1_score": 10, "team2_score": 4},
+        {"match_id": second, "team1_score": 2, "team2_score": 10},
+    ], dry_run=True)
+
+    assert summary["points_awarded"] > 0
+    assert _count(db, "ScheduledMatches") == 2
+    assert _count(db, "ScoreLedger") == 0
+    assert all(score == (0, 0) for score in _teams(db).values())
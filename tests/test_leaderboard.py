@@ -0,0 +1,32 @@
+# tests/test_leaderboard.py
+# The leaderboard pages by (Score, id) and ranks tied teams together.
+
+import database
+
+
+def _set_scores(engine, scores: dict):
+    with engine.begin() as conn:
+        conn.execute(
+            database.text('UPDATE public."Teams" SET "Score" = :score WHERE id = :team_id'),
+            [{"team_id": team_id, "score": score} for team_id, score in scores.items()]
+        )
+
+
+def test_leaderboard_pages_follow_each_other(db, teams):
+    al, cy, ed = teams
+    _set_scores(db, {al: 7.5, cy: 10, ed: 10})
+
+    first = database.get_leaderboard(limit=2)
+    assert [(entry["id"], entry["rank"], entry["gap_to_leader"]) for entry in first] == [(cy, 1, 0), (ed, 1, 0)]
+
+    rest = database.get_leaderboard(limit=2, after_score=first[-1]["Score"], after_id=first[-1]["id"])
+    assert [(entry["id"], entry["rank"], entry["gap_to_leader"]) for entry in rest] == [(al, 3, 2.5)]
+
+
+def test_leaderboard_neighbourhood_surrounds_the_team(db, teams):
+    al, cy, ed = teams
+    _set_scores(db, {al: 30, cy: 20, ed: 10})
+
+    assert [entry["id"] for entry in database.get_leaderboard_neighbourhood(cy, radius=1)] == [al, cy, ed]
+    assert [entry["id"] for entry in database.get_leaderboard_neighbourhood(al, radius=1)] == [al, cy]
+    assert database.get_leaderboard_neighbourhood(999) == []
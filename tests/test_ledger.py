@@ -0,0 +1,30 @@
+# tests/test_ledger.py
+# The ScoreLedger explains every team's score: rebuilding from it or repricing a sport keeps fractional points.
+
+import database
+
+
+def _scores(engine):
+    with engine.connect() as conn:
+        rows = conn.execute(database.text('SELECT id, "Score" FROM public."Teams"'))
+        return {row._mapping["id"]: row._mapping["Score"] for row in rows}
+
+
+def test_half_points_are_kept_and_rebuilt(db, teams):
+    full, half1, half2 = teams
+    database.insert_game("Cornhole", 15, "Multi Play", "", "", "", "")
+    database.submit_half_score(full, half1, half2, "Cornhole", full_team_wins=False)
+    assert _scores(db) == {full: 0, half1: 7.5, half2: 7.5}
+
+    database.rebuild_team_scores()
+    assert _scores(db) == {full: 0, half1: 7.5, half2: 7.5}
+
+
+def test_reprice_rescales_half_points(db, teams):
+    full, half1, half2 = teams
+    database.insert_game("Cornhole", 10, "Multi Play", "", "", "", "")
+    database.submit_half_score(full, half1, half2, "Cornhole", full_team_wins=True)
+    database.submit_half_score(full, half1, half2, "Cornhole", full_team_wins=False)
+
+    assert database.reprice_score_events("Cornhole", 15) == 3
+    assert _scores(db) == {full: 15, half1: 7.5, half2: 7.5}
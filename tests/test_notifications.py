@@ -0,0 +1,66 @@
+# tests/test_notifications.py
+# A committed write bumps the versions of the tables it wrote to; a rolled back one bumps nothing.
+
+import threading
+
+import pytest
+
+import database
+import notifications
+
+
+def test_commit_bumps_only_the_tables_written(db, teams):
+    teams_version = notifications.version("Teams")
+    games_version = notifications.version("Games")
+
+    with db.begin() as conn:
+        conn.execute(database.text('UPDATE public."Teams" SET "Score" = 5'))
+
+    assert notifications.version("Teams") > teams_version
+    assert notifications.version("Games") == games_version
+
+
+def test_rollback_bumps_nothing(db, teams):
+    before = notifications.version()
+
+    with pytest.raises(RuntimeError):
+        with db.begin() as conn:
+            conn.execute(database.text('UPDATE public."Teams" SET "Score" = 5'))
+            raise RuntimeError("abandon the transaction")
+    with db.connect() as conn:
+        conn.execute(database.text('DELETE FROM public."PastGames"'))
+        conn.rollback()
+
+    assert notifications.version() == before
+
+
+def test_a_submit_bumps_every_table_it_changes(db, teams):
+    match_id = database.insert_scheduled_match("Pool", teams[0], teams[1], [], [])
+    tables = ["Teams", "ScheduledMatches", "PastGames", "ScoreLedger", "TeamRatings"]
+    before = {table: notifications.version(table) for table in tables}
+
+    database.submit_match_result(match_id, 10, 4)
+
+    assert all(notifications.version(table) > before[table] for table in tables)
+
+
+def test_wait_for_change_wakes_up_on_a_commit(db, teams):
+    since = notifications.version()
+    writer = threading.Timer(0.05, database.record_score_event, (teams[0], "admin_override", 5))
+    writer.start()
+    try:
+        assert notifications.wait_for_change(since, timeout=5) != since
+    finally:
+        writer.join()
+    assert notifications.wait_for_change(notifications.version(), timeout=0.01) == notifications.version()
+
+
+@pytest.mark.parametrize("statement, table", [
+    ('INSERT INTO public."PastGames" (sport) VALUES (?)', "PastGames"),
+    ('  update public."Teams" SET "Score" = 0', "Teams"),
+    ('DELETE FROM "ScheduledMatches" WHERE id = 1', "ScheduledMatches"),
+    ('TRUNCATE public."TeamTokens" RESTART IDENTITY CASCADE', "TeamTokens"),
+    ('SELECT * FROM public."Teams"', None),
+])
+def test_written_table(statement, table):
+    assert notifications._written_table(statement) == table
@@ -0,0 +1,51 @@
+# tests/test_paging.py
+# Keyset pages follow each other without gaps or repeats, even when rows share a created_at.
+
+import database
+
+
+def _pages(fetch, limit: int):
+    pages = []
+    after = {}
+    while True:
+        page = fetch(limit=limit, **after)
+        if not page:
+            return pages
+        pages.append([row["id"] for row in page])
+        after = {"after_created_at": page[-1]["created_at"], "after_id": page[-1]["id"]}
+
+
+def test_scheduled_matches_pages_cover_every_match_once(db, teams):
+    ids = database.insert_scheduled_matches([
+        {"sport": "Pool", "team1_id": teams[0], "team2_id": teams[1], "handicap1": [], "handicap2": []}
+        for _ in range(7)
+    ])
+
+    pages = _pages(database.get_scheduled_matches_page, 3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [match_id for page in pages for match_id in page] == sorted(ids, reverse=True)
+    assert database.get_scheduled_matches_page(limit=1)[0]["team1_name"] == "Al-Bo"
+
+
+def test_past_games_pages_filter_by_sport_and_team(db, teams):
+    database.add_players_from_team_names()
+    for team1, team2 in [("Al-Bo", "Cy-Di"), ("Cy-Di", "Ed-Fi"), ("Ed-Fi", "Al-Bo")]:
+        database.insert_past_game("Pool", team1, team2, 10, 5)
+    database.insert_past_game("Mini Golf", "1st: Cy, 2nd: Bo", "3rd: Ed", 60, 35)
+    database.insert_past_game("Mini Golf", "1st: Di", "", 60, 35)
+
+    everything = _pages(database.get_past_games_page, 2)
+    assert [len(page) for page in everything] == [2, 2, 1]
+
+    pool = _pages(lambda **kwargs: database.get_past_games_page(sport="Pool", **kwargs), 2)
+    assert sum(len(page) for page in pool) == 3
+
+    al_bo = _pages(lambda **kwargs: database.get_past_games_page(team_name="Al-Bo", **kwargs), 2)
+    assert [len(page) for page in al_bo] == [2, 1]
+
+    # Moving a player to another team changes which placements count for it.
+    database.add_player("Bo", teams[2])
+    al_bo = database.get_past_games_page(team_name="Al-Bo", sport="Mini Golf")
+    ed_fi = database.get_past_games_page(team_name="Ed-Fi", sport="Mini Golf")
+    assert al_bo == [] and len(ed_fi) == 1
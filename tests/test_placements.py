@@ -0,0 +1,56 @@
+# tests/test_placements.py
+# Individual events score each placed player's team through the roster, once per scheduled match.
+
+import pytest
+
+import database
+from tests.test_submit import _count, _teams
+
+
+@pytest.fixture
+def roster(db, teams):
+    database.add_players_from_team_names()
+    return dict(zip(["Al", "Bo", "Cy", "Di", "Ed", "Fi"], [teams[0], teams[0], teams[1], teams[1], teams[2], teams[2]]))
+
+
+def test_award_placements_scores_each_player_for_their_team(db, teams, roster):
+    al, cy, ed = teams
+    match_id = database.insert_scheduled_match("Mini Golf", al, cy, [], [])
+
+    awarded = database.award_placements("Mini Golf", ["Cy", "Bo", "Di"], [60, 35, 20], match_id=match_id)
+
+    assert awarded == {cy: 80, al: 35}
+    assert _teams(db) == {al: (35, 1), cy: (80, 1), ed: (0, 0)}
+    with db.connect() as conn:
+        past = conn.execute(database.text('SELECT team1, team2 FROM public."PastGames"')).one()
+    assert tuple(past) == ("1st: Cy, 2nd: Bo", "3rd: Di")
+
+    assert database.award_placements("Mini Golf", ["Cy", "Bo", "Di"], [60, 35, 20], match_id=match_id) is None
+    assert _count(db, "PastGames") == 1
+    assert _teams(db)[cy] == (80, 1)
+
+
+def test_award_placements_rejects_unknown_and_repeated_players(db, roster):
+    with pytest.raises(ValueError, match="not on any team"):
+        database.award_placements("Mini Golf", ["Cy", "Zed"], [60, 35, 20])
+    with pytest.raises(ValueError, match="one place"):
+        database.award_placements("Mini Golf", ["Cy", "Cy"], [60, 35, 20])
+    assert _count(db, "ScoreLedger") == 0
+
+
+def test_award_placements_claims_the_match_even_when_nothing_is_awarded(db, teams, roster):
+    match_id = database.insert_scheduled_match("Mini Golf", teams[0], teams[1], [], [])
+
+    assert database.award_placements("Mini Golf", [], [60, 35, 20], match_id=match_id) == {}
+    assert database.award_placements("Mini Golf", ["Cy"], [60, 35, 20], match_id=match_id) is None
+    assert _count(db, "ScheduledMatches") == 0
+    assert _count(db, "ScoreLedger") == 0
+
+
+def test_award_placements_counts_zero_point_places(db, teams, roster):
+    al, cy, ed = teams
+    match_id = database.insert_scheduled_match("Mini Golf", al, cy, [], [])
+
+    assert database.award_placements("Mini Golf", ["Ed", "Al"], [0, 0], match_id=match_id) == {ed: 0, al: 0}
+    assert _teams(db) == {al: (0, 1), cy: (0, 0), ed: (0, 1)}
+    assert database.award_placements("Mini Golf", ["Ed", "Al"], [0, 0], match_id=match_id) is None
@@ -0,0 +1,61 @@
+# tests/test_projection.py
+# Checks that projection.simulate() returns proper probabilities: every simulation has exactly one first place and
+# min(3, teams) top-3 places, and expected scores add up to the points at stake.
+
+import numpy as np
+import pytest
+
+import projection
+
+
+def _simulate(expected_points=None, simulations=25000, seed=1):
+    scores = np.array([10.0, 12.0, 8.0, 0.0, 11.0])
+    team1 = np.array([0, 1, 2, 4])
+    team2 = np.array([1, 2, 3, 0])
+    team1_wins = np.array([0.5, 0.7, 0.9, 0.4])
+    points = np.array([5.0, 10.0, 3.0, 5.0])
+    transfers = np.array([False, False, False, True])
+    return projection.simulate(scores, team1, team2, team1_wins, points, transfers, expected_points, simulations, seed)
+
+
+def test_probabilities_add_up():
+    p_first, p_top3, expected_score = _simulate()
+    assert p_first.sum() == pytest.approx(1)
+    assert p_top3.sum() == pytest.approx(3)
+    assert ((p_first >= 0) & (p_first <= p_top3) & (p_top3 <= 1)).all()
+
+
+def test_probabilities_add_up_with_expected_games():
+    rates = np.array([0.6, 0.3])
+    distribution = projection.expected_points_distribution(rates, np.array([5, 10]), 3)
+    assert distribution.sum() == pytest.approx(1)
+    expected_points = [distribution, None, distribution, None, None]
+    # Not a multiple of projection.CHUNK, so the last chunk is a partial one.
+    p_first, p_top3, expected_score = _simulate(expected_points, simulations=projection.CHUNK + 1234)
+    assert p_first.sum() == pytest.approx(1)
+    assert p_top3.sum() == pytest.approx(3)
+    # Each expected game adds 0.6 * 5 / 2 + 0.3 * 10 / 2 = 3 points on average.
+    _, _, without = _simulate(simulations=projection.CHUNK + 1234)
+    assert expected_score[0] - without[0] == pytest.approx(9, abs=0.3)
+
+
+def test_expected_scores_add_up_to_the_points_at_stake():
+    _, _, expected_score = _simulate()
+    # Multi Play wins add their points; the Duel only moves points between teams.
+    assert expected_score.sum() == pytest.approx(41 + 5 + 10 + 3)
+
+
+def test_fewer_than_three_teams():
+    p_first, p_top3, _ = projection.simulate(
+        np.array([3.0, 1.0]), np.array([0]), np.array([1]), np.array([0.5]), np.array([5.0]), np.array([False]),
+        simulations=1000, seed=1,
+    )
+    assert p_first.sum() == pytest.approx(1)
+    assert p_top3.tolist() == [1, 1]
+
+
+def test_seeded_runs_repeat():
+    first = _simulate(seed=7)
+    second = _simulate(seed=7)
+    for a, b in zip(first, second):
+        assert np.array_equal(a, b)
@@ -0,0 +1,59 @@
+# tests/test_ratings.py
+# Pins the Elo rules in ratings.py, and that rating a history from scratch matches rating it one result at a time.
+
+import pytest
+
+import ratings
+
+TEAMS = [{"id": 1, "team_name": "Al-Bo"}, {"id": 2, "team_name": "Cy-Di"}, {"id": 3, "team_name": "Ed-Fi"}]
+GAMES = {"Pool": {"type": "Multi Play"}, "Darts": {"type": "Multi Play"}, "Bowling": {"type": "Single Play"}}
+
+
+def _game(sport, team1, team2, team1_score, team2_score):
+    return {"sport": sport, "team1": team1, "team2": team2, "team1_score": team1_score, "team2_score": team2_score}
+
+
+def test_update_between_equal_ratings():
+    assert ratings.update(1500, 1500, 3, 1) == (1516, 1484)
+    assert ratings.update(1500, 1500, 1, 3) == (1484, 1516)
+    assert ratings.update(1500, 1500, 2, 2) == (1500, 1500)
+
+
+def test_update_is_zero_sum_and_rewards_upsets_more():
+    favourite_wins = ratings.update(1700, 1500, 3, 1)
+    underdog_wins = ratings.update(1700, 1500, 1, 3)
+    assert sum(favourite_wins) == pytest.approx(3200)
+    assert sum(underdog_wins) == pytest.approx(3200)
+    assert 1700 - underdog_wins[0] > favourite_wins[0] - 1700
+
+
+def test_recompute_matches_updating_one_result_at_a_time():
+    history = [
+        _game("Pool", "Al-Bo", "Cy-Di", 5, 3),
+        _game("Pool", "Cy-Di", "Ed-Fi", 2, 2),
+        _game("Darts", "Ed-Fi", "Al-Bo", 1, 4),
+        _game("Pool", "Ed-Fi", "Al-Bo", 6, 0),
+        _game("Darts", "Cy-Di", "Al-Bo", None, 2),
+    ]
+    expected = {}
+    for game in history:
+        ids = [next(team["id"] for team in TEAMS if team["team_name"] == game[side]) for side in ("team1", "team2")]
+        rating1, games1 = expected.get((ids[0], game["sport"]), (ratings.DEFAULT_RATING, 0))
+        rating2, games2 = expected.get((ids[1], game["sport"]), (ratings.DEFAULT_RATING, 0))
+        rating1, rating2 = ratings.update(rating1, rating2, game["team1_score"] or 0, game["team2_score"] or 0)
+        expected[(ids[0], game["sport"])] = (rating1, games1 + 1)
+        expected[(ids[1], game["sport"])] = (rating2, games2 + 1)
+
+    # Same operations in the same order, so the floats match exactly.
+    assert ratings.recompute(TEAMS, history, GAMES) == expected
+    assert expected[(1, "Pool")][1] == 2
+
+
+def test_recompute_skips_unrated_games():
+    history = [
+        _game("Bowling", "Al-Bo", "Cy-Di", 10, 5),
+        _game("Duel", "Al-Bo", "Cy-Di", 1, 0),
+        _game("Pool", "Al-Bo", "Gone-Team", 5, 3),
+        _game("Mini Golf", "1st: Al, 2nd: Cy", "", 60, 35),
+    ]
+    assert ratings.recompute(TEAMS, history, GAMES) == {}
@@ -0,0 +1,51 @@
+# tests/test_schema.py
+# Migrations bring any database to SCHEMA_VERSION once, and the hot queries use their indexes afterwards.
+
+from sqlalchemy import func, select
+
+import schema
+from storage import create_sqlite_engine
+
+
+def test_bootstrap_applies_every_migration_once():
+    engine = create_sqlite_engine(":memory:")
+    try:
+        with engine.connect() as conn:
+            assert schema.get_schema_version(conn) == schema.SCHEMA_VERSION
+        assert [version for version, _, _ in schema.MIGRATIONS] == list(range(1, schema.SCHEMA_VERSION + 1))
+
+        assert schema.migrate(engine) == []
+        schema.bootstrap_schema(engine)
+        with engine.connect() as conn:
+            games = conn.execute(select(func.count()).select_from(schema.games_table)).scalar()
+            versions = conn.execute(select(func.count()).select_from(schema.schema_version_table)).scalar()
+        assert games == len(schema.games)
+        assert versions == schema.SCHEMA_VERSION
+    finally:
+        engine.dispose()
+
+
+def test_migrations_seed_existing_data():
+    engine = create_sqlite_engine(":memory:", bootstrap=False)
+    try:
+        schema.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(schema.teams_table.insert(), [{"team_name": "Al-Bo"}, {"team_name": "Cy-Di"}])
+            conn.execute(schema.games_table.insert(), [{"name": "Pool", "points": 25, "type": "Multi Play"}])
+            conn.execute(schema.past_games_table.insert(), [
+                {"sport": "Pool", "team1": "Al-Bo", "team2": "Cy-Di", "team1_score": 10, "team2_score": 4},
+            ])
+
+        assert schema.migrate(engine) == list(range(1, schema.SCHEMA_VERSION + 1))
+        with engine.connect() as conn:
+            players = conn.execute(select(schema.players_table.c.name).order_by(schema.players_table.c.name))
+            assert [row.name for row in players] == ["Al", "Bo", "Cy", "Di"]
+            ratings = conn.execute(select(schema.team_ratings_table.c.games))
+            assert [row.games for row in ratings] == [1, 1]
+    finally:
+        engine.dispose()
+
+
+def test_hot_queries_use_their_indexes(db):
+    failures = [name for name, ok, _ in schema.check_query_plans(db) if not ok]
+    assert failures == []
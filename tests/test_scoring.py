@@ -0,0 +1,142 @@
+# tests/test_scoring.py
+# Pins the scoring rules in scoring.py: what each result awards, including the Comeback and overtime edge cases.
+
+import pytest
+
+from scoring import TeamState, score_half, score_match, score_placements
+
+
+def _points(delta):
+    """
+    team_id -> points awarded by a delta's ScoreLedger entries.
+    """
+    points = {}
+    for event in delta.score_events:
+        points[event["team_id"]] = points.get(event["team_id"], 0) + event["points"]
+    return points
+
+
+def test_match_win_awards_points_and_streaks():
+    delta = score_match(TeamState(id=1), TeamState(id=2), "Pool", 10, 7, 3, reference="match 5")
+    assert (delta.winner_id, delta.loser_id, delta.points_awarded) == (1, 2, 10)
+    assert delta.score_events == [{
+        "team_id": 1, "kind": "match_win", "points": 10, "sport": "Pool", "game_points": 10, "reference": "match 5",
+    }]
+    assert delta.win_streaks == {(1, "Pool"): 1, (2, "Pool"): 0}
+    assert delta.team_fields == {
+        1: {"Games_played": 1, "Lose_Streak": 0, "Overtime_Games_Lost": 0},
+        2: {"Games_played": 1, "Lose_Streak": 1, "Overtime_Games_Lost": 0},
+    }
+    assert delta.token_deltas == {}
+    assert not delta.comeback_used
+
+
+def test_match_team2_can_win():
+    delta = score_match(TeamState(id=1), TeamState(id=2), "Pool", 10, 0, 6)
+    assert (delta.winner_id, delta.loser_id) == (2, 1)
+    assert _points(delta) == {2: 10}
+    # Scoring nothing earns the loser a Peasant token.
+    assert delta.token_deltas == {(1, "Peasant"): 1}
+
+
+def test_match_draw_only_counts_a_game_played():
+    delta = score_match(TeamState(id=1, games_played=4), TeamState(id=2), "Pool", 10, 3, 3)
+    assert delta.winner_id is None
+    assert delta.points_awarded == 0
+    assert delta.score_events == []
+    assert delta.win_streaks == {}
+    assert delta.token_deltas == {}
+    assert delta.team_fields[1]["Games_played"] == 5
+    assert delta.team_fields[2]["Games_played"] == 1
+
+
+def test_comeback_token_doubles_the_points_and_is_spent():
+    winner = TeamState(id=1, tokens={"Comeback": 2})
+    delta = score_match(winner, TeamState(id=2), "Pool", 10, 5, 1)
+    assert delta.comeback_used
+    assert delta.points_awarded == 20
+    assert _points(delta) == {1: 20}
+    assert delta.token_deltas == {(1, "Comeback"): -1}
+
+
+def test_comeback_token_of_the_loser_is_not_spent():
+    loser = TeamState(id=2, tokens={"Comeback": 1})
+    delta = score_match(TeamState(id=1), loser, "Pool", 10, 5, 1)
+    assert not delta.comeback_used
+    assert _points(delta) == {1: 10}
+    assert (2, "Comeback") not in delta.token_deltas
+
+
+def test_third_loss_in_a_row_earns_a_comeback_token():
+    delta = score_match(TeamState(id=1), TeamState(id=2, lose_streak=2), "Pool", 10, 5, 1)
+    assert delta.token_deltas == {(2, "Comeback"): 1}
+    assert delta.team_fields[2]["Lose_Streak"] == 0
+
+
+def test_third_win_in_a_row_earns_a_wizard_token():
+    delta = score_match(TeamState(id=1, win_streaks={"Pool": 2}), TeamState(id=2), "Pool", 10, 5, 1)
+    assert delta.win_streaks[(1, "Pool")] == 3
+    assert delta.token_deltas == {(1, "Wizard"): 1}
+    # Only the third win earns one.
+    delta = score_match(TeamState(id=1, win_streaks={"Pool": 3}), TeamState(id=2), "Pool", 10, 5, 1)
+    assert delta.token_deltas == {}
+
+
+@pytest.mark.parametrize("team1_score, team2_score, overtime", [(5, 3, True), (4, 3, True), (6, 3, False)])
+def test_overtime_is_a_loss_by_two_or_less(team1_score, team2_score, overtime):
+    delta = score_match(TeamState(id=1), TeamState(id=2), "Pool", 10, team1_score, team2_score)
+    assert delta.team_fields[2]["Overtime_Games_Lost"] == (1 if overtime else 0)
+    assert delta.token_deltas == {}
+
+
+def test_second_overtime_loss_earns_a_duel_token():
+    delta = score_match(TeamState(id=1, overtime_games_lost=1), TeamState(id=2), "Pool", 10, 2, 4)
+    assert delta.token_deltas == {(1, "Duel"): 1}
+    assert delta.team_fields[1]["Overtime_Games_Lost"] == 0
+
+
+def test_half_game_full_team_win():
+    full = TeamState(id=1, win_streaks={"Darts": 2})
+    delta = score_half(full, TeamState(id=2), TeamState(id=3), "Darts", 9, full_team_wins=True)
+    assert (delta.winner_id, delta.points_awarded) == (1, 9)
+    assert _points(delta) == {1: 9}
+    assert delta.win_streaks == {(1, "Darts"): 3}
+    assert delta.token_deltas == {(1, "Wizard"): 1}
+
+
+def test_half_game_half_teams_split_the_points():
+    delta = score_half(TeamState(id=1), TeamState(id=2), TeamState(id=3), "Darts", 9, full_team_wins=False)
+    assert delta.winner_id is None
+    # Odd point values are split exactly, not rounded.
+    assert _points(delta) == {2: 4.5, 3: 4.5}
+    assert delta.points_awarded == 4.5
+    assert delta.token_deltas == {}
+    assert delta.team_fields == {}
+
+
+def test_half_game_loss_after_a_losing_streak_gives_half_team_2_a_comeback():
+    full = TeamState(id=1, lose_streak=3)
+    delta = score_half(full, TeamState(id=2), TeamState(id=3, lose_streak=1), "Darts", 8, full_team_wins=False)
+    assert delta.token_deltas == {(3, "Comeback"): 1}
+    assert delta.team_fields == {3: {"Lose_Streak": 0}}
+
+
+def test_placements_award_points_per_place():
+    placements = [("Alice", 1), ("Bob", 2), ("Carol", 1)]
+    delta = score_placements(placements, [60, 35, 20], "Mini Golf")
+    assert [(event["team_id"], event["points"], event["reference"]) for event in delta.score_events] == [
+        (1, 60, "1st place: Alice"), (2, 35, "2nd place: Bob"), (1, 20, "3rd place: Carol"),
+    ]
+    assert _points(delta) == {1: 80, 2: 35}
+    assert (delta.winner_id, delta.points_awarded) == (1, 60)
+
+
+def test_placements_beyond_the_points_table_are_rejected():
+    with pytest.raises(ValueError):
+        score_placements([("Alice", 1), ("Bob", 2)], [60], "Mini Golf")
+
+
+def test_fewer_placements_than_places():
+    delta = score_placements([("Alice", 1)], [60, 35, 20], "Mini Golf")
+    assert _points(delta) == {1: 60}
+    assert score_placements([], [60, 35, 20], "Mini Golf").score_events == []
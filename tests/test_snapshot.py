@@ -0,0 +1,25 @@
+# tests/test_snapshot.py
+# The dashboard snapshot is shared by every session and reloaded only after a write to one of its tables.
+
+import database
+
+
+def test_shared_snapshot_reloads_after_a_write(db, teams):
+    with db.begin() as conn:
+        conn.execute(database.text(
+            f'INSERT INTO public."TeamTokens" (team_id, token_name, count) VALUES ({teams[1]}, \'Duel\', 1)'
+        ))
+        conn.execute(database.text('INSERT INTO public."NonGameRule" (rule, penalty) VALUES (\'No phones\', 2)'))
+
+    snapshot, version = database.get_shared_snapshot()
+    assert [team["team_name"] for team in snapshot.teams] == ["Al-Bo", "Cy-Di", "Ed-Fi"]
+    assert snapshot.tokens_by_team == {teams[0]: {}, teams[1]: {"Duel": 1}, teams[2]: {}}
+    assert snapshot.non_game_rules == [{"rule": "No phones", "penalty": 2}]
+
+    # Writes to other tables keep the same snapshot object.
+    database.insert_scheduled_match("Pool", teams[0], teams[1], [], [])
+    assert database.get_shared_snapshot() == (snapshot, version)
+
+    database.record_score_event(teams[0], "admin_override", 5)
+    reloaded, new_version = database.get_shared_snapshot()
+    assert new_version != version and reloaded.team_by_id(teams[0])["Score"] == 5
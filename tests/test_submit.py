@@ -0,0 +1,56 @@
+# tests/test_submit.py
+# Submitting a result applies all of its changes in one transaction, exactly once.
+
+import pytest
+
+import database
+
+
+def _count(engine, table: str):
+    with engine.connect() as conn:
+        return conn.execute(database.text(f'SELECT COUNT(*) FROM public."{table}"')).scalar()
+
+
+def _teams(engine):
+    with engine.connect() as conn:
+        rows = conn.execute(database.text('SELECT id, "Score", "Games_played" FROM public."Teams"'))
+        return {row._mapping["id"]: (row._mapping["Score"], row._mapping["Games_played"]) for row in rows}
+
+
+def _ratings(engine):
+    with engine.connect() as conn:
+        rows = conn.execute(database.text('SELECT team_id, sport, games FROM public."TeamRatings"'))
+        return {(row._mapping["team_id"], row._mapping["sport"]): row._mapping["games"] for row in rows}
+
+
+def test_submit_match_result_applies_the_result_once(db, teams):
+    al, cy, ed = teams
+    first = database.insert_scheduled_match("Pool", cy, ed, [], [])
+    second = database.insert_scheduled_match("Pool", cy, ed, [], [])
+
+    result = database.submit_match_result(first, 10, 5)
+    assert result["winner_id"] == cy and result["points_awarded"] == 25
+    assert database.submit_match_result(first, 10, 5) is None
+
+    database.submit_match_result(second, 3, 10)
+    assert _teams(db) == {al: (0, 0), cy: (25, 2), ed: (25, 2)}
+    assert _ratings(db) == {(cy, "Pool"): 2, (ed, "Pool"): 2}
+    assert _count(db, "PastGames") == 2
+    assert _count(db, "ScheduledMatches") == 0
+
+    # The ledger explains the running scores.
+    database.rebuild_team_scores()
+    assert _teams(db) == {al: (0, 0), cy: (25, 2), ed: (25, 2)}
+
+
+def test_submit_match_result_changes_nothing_when_it_fails(db, teams):
+    match_id = database.insert_scheduled_match("Pool", teams[0], 999, [], [])
+
+    with pytest.raises(ValueError):
+        database.submit_match_result(match_id, 10, 5)
+
+    assert _count(db, "ScheduledMatches") == 1
+    assert _count(db, "ScoreLedger") == 0
+    assert _count(db, "PastGames") == 0
+    assert _count(db, "TeamRatings") == 0
+    assert _teams(db)[teams[0]] == (0, 0)
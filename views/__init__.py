@@ -0,0 +1,3 @@
+# views/
+# One module per navigation page of app.py, each with a render() function that draws the page on every rerun.
+# (Not named pages/, which Streamlit would turn into its own multipage navigation.)
@@ -0,0 +1,155 @@
+# views/admin_panel.py
+# The Admin Panel: resets, point overrides, the roster, result imports, history exports and performance metrics.
+
+import os
+import tempfile
+
+import streamlit as st
+
+import cache
+import instrumentation
+import notifications
+from database import (
+    EXPORTABLE_TABLES, add_player, add_players_from_team_names, clear_database, get_all_teams, get_roster,
+    import_match_results, recompute_ratings, record_score_event, reset_teams_stats,
+)
+from export import FORMATS as EXPORT_FORMATS, export_table
+from results_import import parse_results
+
+
+def render():
+    st.header("Admin Panel")
+    admin_password = st.text_input("Enter Admin Password", type="password")
+    if st.button("Clear Database"):
+        if admin_password == "coldpalm":
+            clear_database()
+            st.success("Database cleared successfully!")
+        else:
+            st.error("Incorrect password. Database not cleared.")
+    st.markdown("---")
+    if st.button("Reset Teams Stats"):
+        if admin_password == "coldpalm":
+            reset_teams_stats()
+            st.success("Teams table stats have been reset successfully!")
+        else:
+            st.error("Incorrect password. Teams stats not reset.")
+    st.markdown("---")
+    if st.button("Recompute Ratings"):
+        if admin_password == "coldpalm":
+            st.success(f"Recomputed {recompute_ratings()} team ratings from past games.")
+        else:
+            st.error("Incorrect password. Ratings not recomputed.")
+    st.markdown("---")
+    st.header("Override Team Points")
+    teams = get_all_teams()
+    team_options = {team["team_name"]: team for team in teams}
+    team_name = st.selectbox("Select Team", list(team_options.keys()), key="override_team")
+    adjustment = st.number_input("Adjustment (negative to remove points)", step=1)
+    if st.button("Apply Override"):
+        if admin_password == "coldpalm":
+            team = team_options[team_name]
+            record_score_event(team["id"], "admin_override", adjustment)
+            st.success(f"{team_name}'s score adjusted by {adjustment}.")
+        else:
+            st.error("Incorrect password. Cannot override points.")
+    st.markdown("---")
+    st.header("Roster")
+    roster_teams = {team["team_name"]: team["id"] for team in teams}
+    team_names_by_id = {team_id: name for name, team_id in roster_teams.items()}
+    roster = get_roster()
+    if roster["players"]:
+        st.table([
+            {"Player": player["name"], "Team": team_names_by_id.get(player["team_id"], "Unknown")}
+            for player in roster["players"]
+        ])
+    player_name = st.text_input("Player Name")
+    player_team = st.selectbox("Player's Team", list(roster_teams.keys()), key="roster_team")
+    if st.button("Add Player"):
+        if admin_password == "coldpalm":
+            if player_name.strip() and player_team:
+                add_player(player_name, roster_teams[player_team])
+                st.success(f"{player_name.strip()} plays for {player_team}.")
+            else:
+                st.error("Enter a player name and choose a team.")
+        else:
+            st.error("Incorrect password. Player not added.")
+    if st.button("Add Players from Team Names"):
+        if admin_password == "coldpalm":
+            st.success(f"Added {add_players_from_team_names()} players.")
+        else:
+            st.error("Incorrect password. Players not added.")
+    st.markdown("---")
+    st.header("Import Results")
+    st.caption("Upload a CSV (match_id, team1_score, team2_score[, sport]) or a JSON list of the same fields. "
+               "Every result is applied in one transaction, or none is.")
+    results_file = st.file_uploader("Results File", type=["csv", "json"])
+    if results_file is not None and st.button("Import Results"):
+        if admin_password == "coldpalm":
+            file_format = "json" if results_file.name.lower().endswith(".json") else "csv"
+            try:
+                summary = import_match_results(parse_results(results_file.getvalue().decode("utf-8"), file_format))
+            except ValueError as e:
+                st.error(f"Nothing imported: {e}")
+            else:
+                st.success(f"Imported {summary['imported']} results: {summary['points_awarded']:g} points "
+                           f"and {summary['tokens_awarded']} tokens awarded.")
+        else:
+            st.error("Incorrect password. Results not imported.")
+    st.markdown("---")
+    st.header("Export History")
+    st.caption("For very large histories use `python export.py`, which writes files without going through the browser.")
+    export_table_name = st.selectbox("Table", EXPORTABLE_TABLES, key="export_table")
+    export_format = st.radio("Format", list(EXPORT_FORMATS), horizontal=True, key="export_format")
+    if st.button("Prepare Export"):
+        if admin_password == "coldpalm":
+            # One directory per session holding only the latest export, so repeated exports do not pile up.
+            export_dir = st.session_state.get("export_dir")
+            if not export_dir or not os.path.isdir(export_dir):
+                export_dir = st.session_state["export_dir"] = tempfile.mkdtemp(prefix="game-export-")
+            previous_path = st.session_state.pop("export_path", None)
+            if previous_path and os.path.exists(previous_path):
+                os.remove(previous_path)
+            export_path = os.path.join(export_dir, export_table_name + EXPORT_FORMATS[export_format])
+            rows = export_table(export_table_name, export_path, export_format)
+            st.session_state["export_path"] = export_path
+            st.success(f"Exported {rows} rows.")
+        else:
+            st.error("Incorrect password. Nothing exported.")
+    if st.session_state.get("export_path") and os.path.exists(st.session_state["export_path"]):
+        with open(st.session_state["export_path"], "rb") as export_file:
+            st.download_button("Download Export", export_file, file_name=os.path.basename(st.session_state["export_path"]))
+    st.markdown("---")
+    st.header("Performance")
+    st.caption(
+        f"Statement and page timings since the app started (last {instrumentation.BUFFER_SIZE} of each)."
+    )
+    st.subheader("Pages")
+    st.dataframe(instrumentation.summarize_pages())
+    st.subheader("Database Functions")
+    st.dataframe(instrumentation.summarize_functions())
+    st.subheader("Statements")
+    st.dataframe(instrumentation.summarize_statements())
+    st.subheader("Change Listener")
+    listener_status = notifications.listener_status()
+    if listener_status == "off":
+        st.caption("Not used: only this app process's own writes are followed.")
+    elif listener_status == "connected":
+        st.success("Connected: writes from other app processes are picked up.")
+    else:
+        st.warning("Disconnected: writes from other app processes are missed until it reconnects.")
+    st.subheader("Read Cache")
+    if cache.backend is None:
+        st.caption("Caching is off (GAME_CACHE_BACKEND=off).")
+    else:
+        st.caption(f"{cache.backend.name} backend, {len(cache.backend)} entries.")
+        st.dataframe(cache.stats())
+    st.download_button(
+        "Export Metrics (JSON)", instrumentation.export_json(), file_name="metrics.json", mime="application/json"
+    )
+    if st.button("Reset Metrics"):
+        if admin_password == "coldpalm":
+            instrumentation.reset()
+            cache.reset_stats()
+            st.success("Metrics cleared.")
+        else:
+            st.error("Incorrect password. Metrics not cleared.")
@@ -0,0 +1,35 @@
+# views/available_games.py
+# The Available Games page: list the games and add new ones.
+
+import streamlit as st
+
+from database import get_all_games, insert_game
+
+
+def render():
+    st.header("Available Games")
+    st.subheader("Add New Game")
+    new_game_name = st.text_input("Game Name")
+    new_game_points = st.number_input("Points", min_value=0, step=1)
+    new_game_type = st.text_input("Game Type (e.g., Multi Play)")
+    new_handicap1 = st.text_input("Handicap Level 1")
+    new_handicap2 = st.text_input("Handicap Level 2")
+    new_handicap3 = st.text_input("Handicap Level 3")
+    new_handicap4 = st.text_input("Handicap Level 4")
+    if st.button("Add Game"):
+        if new_game_name and new_game_points and new_game_type and new_handicap1 and new_handicap2 and new_handicap3 and new_handicap4:
+            new_game_id = insert_game(new_game_name, new_game_points, new_game_type,
+                                       new_handicap1, new_handicap2, new_handicap3, new_handicap4)
+            st.success(f"Game '{new_game_name}' added successfully with ID {new_game_id}!")
+        else:
+            st.error("Please fill in all fields.")
+
+    st.subheader("Existing Games")
+    all_games = get_all_games()
+    if all_games:
+        for game in all_games:
+            st.write(f"**{game['name']}** - Points: {game['points']}, Type: {game['type']}")
+            st.write("Handicaps:", game["handicap1"], "|", game["handicap2"], "|", game["handicap3"], "|", game["handicap4"])
+            st.markdown("---")
+    else:
+        st.info("No games found.")
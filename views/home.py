@@ -0,0 +1,149 @@
+# views/home.py
+# The Home page: the leaderboard, the current non-game rules and the tokens in play.
+
+import os
+
+import streamlit as st
+
+import notifications
+import projection
+from database import (
+    SNAPSHOT_TABLES, get_leaderboard, get_leaderboard_neighbourhood, get_shared_snapshot, record_score_event,
+)
+from storage import ASYNC_PAGES
+from token_data import tokens as token_definitions
+
+# Seconds between the Home page's checks for new results (GAME_LIVE_REFRESH, 0 turns live updates off).
+LIVE_REFRESH = float(os.environ.get("GAME_LIVE_REFRESH", "3"))
+# The tables the Home page is rendered from: the snapshot, the leaderboard and the projection.
+HOME_TABLES = SNAPSHOT_TABLES + ("LocationStandings", "ScheduledMatches")
+
+
+def _leaderboard_display_row(entry: dict):
+    name = entry["team_name"]
+    if entry.get("king"):
+        name += " 👑"
+    if entry["rank_change"] is None or entry["rank_change"] == 0:
+        change = "–"
+    elif entry["rank_change"] > 0:
+        change = f"▲ {entry['rank_change']}"
+    else:
+        change = f"▼ {-entry['rank_change']}"
+    return {
+        "Rank": entry["rank"],
+        "Team": name,
+        "Score": f"{entry['Score']:g}",
+        "Behind Leader": f"{entry['gap_to_leader']:g}",
+        "Since Last Location": change,
+        "Games Played": entry.get("Games_played", 0),
+    }
+
+
+@st.fragment(run_every=LIVE_REFRESH or None)
+def _rerun_on_change(tables: tuple, version: int):
+    """
+    Reruns the page once a write changes one of the tables it was rendered from at `version`.
+    Until then each check only compares in-process counters (see notifications.py) and runs no query.
+    """
+    if notifications.version(*tables) != version:
+        st.rerun()
+
+
+def render():
+    # --- Leaderboard ---
+    st.markdown("## Leaderboard")
+    # Only the top of the table and one team's neighbourhood are read, in score order, from the database.
+    top_n = st.number_input("Teams to show", min_value=1, value=10, step=1)
+    home_version = notifications.version(*HOME_TABLES)
+    # Teams, rules and tokens come from the snapshot shared by every session, reloaded only after a write.
+    if ASYNC_PAGES:
+        # A reload runs the snapshot's independent reads concurrently on the async engine.
+        import async_database
+        snapshot, _ = get_shared_snapshot(lambda: async_database.run(async_database.load_dashboard_snapshot()))
+    else:
+        snapshot, _ = get_shared_snapshot()
+    top_entries = get_leaderboard(limit=int(top_n))
+    teams = snapshot.teams
+    st.table([_leaderboard_display_row(entry) for entry in top_entries])
+    if len(teams) > top_n:
+        team_ids = {team["team_name"]: team["id"] for team in teams}
+        focus_team = st.selectbox("Show a team's position", list(team_ids.keys()))
+        st.table([_leaderboard_display_row(entry) for entry in get_leaderboard_neighbourhood(team_ids[focus_team])])
+
+    # --- Projection ---
+    st.markdown("## Who Can Still Become King?")
+    if teams:
+        most_played = max((team["Games_played"] or 0) for team in teams)
+        games_per_team = st.number_input(
+            "Games each team plays in total", min_value=0, value=most_played, step=1,
+            help="Teams with fewer games played (including scheduled matches) play the rest against average opponents.",
+        )
+        # Cached per version of the tables it reads: reruns reuse it until a result or schedule change.
+        projected = projection.project_standings(int(games_per_team))
+        st.caption(f"{projection.SIMULATIONS:,} simulations of the scheduled matches and the games still to play.")
+        st.table([
+            {
+                "Team": row["team_name"],
+                "Score": f"{row['score']:g}",
+                "Games Left": row["remaining"],
+                "King": f"{row['p_first']:.1%}",
+                "Top 3": f"{row['p_top3']:.1%}",
+                "Expected Score": round(row["expected_score"], 1),
+            }
+            for row in projected[:int(top_n)]
+        ])
+
+    # --- Non-Game Rules ---
+    st.markdown("## Current Non-Game Rules")
+    rules = snapshot.non_game_rules
+    if rules:
+        for rule in rules:
+            st.write(f"**Rule:** {rule['rule']}  —  **Penalty:** {rule['penalty']}")
+            st.subheader("Log a Rule Break")
+        # Allow user to choose which rule was broken
+        if rules:
+            rule_options = {f"{rule['rule']} (Penalty: {rule['penalty']})": rule for rule in rules}
+            selected_rule_desc = st.selectbox("Select the rule that was broken", list(rule_options.keys()))
+            selected_rule = rule_options[selected_rule_desc]
+        else:
+            selected_rule = None
+            # List all teams for selection
+        if teams:
+            team_options = {team["team_name"]: team for team in teams}
+            selected_team_name = st.selectbox("Select the team that broke the rule", list(team_options.keys()))
+            rule_break_team = team_options[selected_team_name]
+        else:
+            rule_break_team = None
+
+        if st.button("Log Rule Break"):
+            if selected_rule is None or rule_break_team is None:
+                st.error("Please select both a rule and a team.")
+            else:
+                penalty = selected_rule["penalty"]
+                record_score_event(rule_break_team["id"], "rule_break", -penalty, reference=selected_rule["rule"])
+                st.success(f"Logged rule break: {rule_break_team['team_name']}'s score deducted by {penalty} points.")
+    else:
+        st.info("No non-game rules set.")
+
+
+
+
+    # --- Tokens In Play ---
+    st.markdown("## Tokens In Play")
+    tokens_found = False
+    for team in teams:
+        team_tokens = snapshot.tokens_by_team.get(team["id"], {})
+        if team_tokens and any(count > 0 for count in team_tokens.values()):
+            tokens_found = True
+            st.subheader(f"Team: {team['team_name']} (ID: {team['id']})")
+            for token_name, count in team_tokens.items():
+                if count > 0:
+                    st.write(f"**{token_name}:** {count} available")
+                    token_info = token_definitions.get(token_name, {})
+                    st.write(f"**Benefit:** {token_info.get('benefit', 'No benefit info available')}")
+            st.markdown("---")
+    if not tokens_found:
+        st.info("No tokens available for any team.")
+
+    # A leaderboard left open (e.g. on a TV) redraws itself only when a result or rule actually changes it.
+    _rerun_on_change(HOME_TABLES, home_version)
@@ -0,0 +1,17 @@
+# views/leave_location.py
+# The Leave Location page: crown the leading team and reset the non-game rules.
+
+import streamlit as st
+
+from database import leave_location
+
+
+def render():
+    st.header("Leave Current Location")
+    if st.button("Leave Location"):
+        # Crowning the top team, recording ranks and resetting the rules happen in one transaction.
+        new_king = leave_location()
+        if new_king:
+            st.success(f"Location left. New King is: {new_king['team_name']}. Non-game rules have been reset.")
+        else:
+            st.warning("No teams found to determine King.")
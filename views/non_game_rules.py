@@ -0,0 +1,85 @@
+# views/non_game_rules.py
+# The Non-Game Rules page: add a rule (as the King or with a Peasant token) and log rule breaks.
+
+import streamlit as st
+
+from database import adjust_token, get_shared_snapshot, record_score_event, set_non_game_rule
+
+
+def render():
+    st.header("Non-Game Rules")
+    
+    # Current non-game rules, teams and tokens come from the shared snapshot
+    snapshot, _ = get_shared_snapshot()
+    rules = snapshot.non_game_rules
+    if rules:
+        st.subheader("Current Rules:")
+        for rule in rules:
+            st.write(f"**Rule:** {rule['rule']}  —  **Penalty:** {rule['penalty']}")
+    else:
+        st.info("No non-game rules set.")
+    
+    st.markdown("---")
+    st.subheader("Add a New Non-Game Rule")
+    new_rule = st.text_input("Enter a new non-game rule")
+    new_penalty = st.number_input("Penalty points for breaking the rule", step=1)
+    
+    # Determine eligible teams:
+    # - Teams with a "Peasant" token are eligible to add a rule.
+    # - If none have a Peasant token, then eligible teams are those with king = True.
+    teams = snapshot.teams
+    eligible_teams = []
+    for team in teams:
+        tokens = snapshot.tokens_by_team.get(team["id"], {})
+        if tokens.get("Peasant", 0) > 0:
+            eligible_teams.append(team)
+    if not eligible_teams:
+        eligible_teams = [team for team in teams if team.get("king")]
+    
+    if eligible_teams:
+        team_options = {team["team_name"]: team for team in eligible_teams}
+        selected_team_name = st.selectbox("Select Team to Add Rule", list(team_options.keys()))
+        selected_team = team_options[selected_team_name]
+    else:
+        st.warning("No eligible teams available to add a rule.")
+        selected_team = None
+
+    if st.button("Add Rule"):
+        if not new_rule:
+            st.error("Please enter a valid rule.")
+        elif selected_team is None:
+            st.error("No eligible team selected to add the rule.")
+        else:
+            # Spends a Peasant token if the team has one left; the King needs none.
+            if adjust_token(selected_team["id"], "Peasant", -1) is not None:
+                st.info(f"{selected_team['team_name']} used a Peasant token to add the rule.")
+            else:
+                st.info(f"{selected_team['team_name']} (King) added the rule.")
+            set_non_game_rule(new_rule, new_penalty)
+            st.success("Non-game rule added!")
+    
+    st.markdown("---")
+    st.subheader("Log a Rule Break")
+    # Allow user to choose which rule was broken
+    if rules:
+        rule_options = {f"{rule['rule']} (Penalty: {rule['penalty']})": rule for rule in rules}
+        selected_rule_desc = st.selectbox("Select the rule that was broken", list(rule_options.keys()))
+        selected_rule = rule_options[selected_rule_desc]
+    else:
+        selected_rule = None
+
+    # List all teams for selection
+    if teams:
+        team_options = {team["team_name"]: team for team in teams}
+        selected_team_name = st.selectbox("Select the team that broke the rule", list(team_options.keys()))
+        rule_break_team = team_options[selected_team_name]
+    else:
+        rule_break_team = None
+
+    if st.button("Log Rule Break"):
+        if selected_rule is None or rule_break_team is None:
+            st.error("Please select both a rule and a team.")
+        else:
+            penalty = selected_rule["penalty"]
+            record_score_event(rule_break_team["id"], "rule_break", -penalty, reference=selected_rule["rule"])
+            st.success(f"Logged rule break: {rule_break_team['team_name']}'s score deducted by {penalty} points.")
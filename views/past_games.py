@@ -0,0 +1,38 @@
+# views/past_games.py
+# The Past Games page: browse played games by sport and team, one page at a time.
+
+import streamlit as st
+
+from database import get_all_games, get_all_teams, get_past_games_page
+from views.widgets import keyset_pager, page_cursor
+
+
+def render():
+    st.header("Past Games")
+    sport_filter = st.selectbox("Sport", ["All"] + [game["name"] for game in get_all_games()] + ["Duel"])
+    team_filter = st.selectbox("Team", ["All"] + [team["team_name"] for team in get_all_teams()])
+    page_size = st.number_input("Games per page", min_value=10, max_value=200, value=25, step=5)
+    sport = None if sport_filter == "All" else sport_filter
+    team_name = None if team_filter == "All" else team_filter
+    # Every filter combination keeps its own page position.
+    pages_key = f"past_games_pages:{sport}:{team_name}"
+    after_created_at, after_id = page_cursor(pages_key)
+    games_page = keyset_pager(
+        pages_key,
+        get_past_games_page(page_size + 1, after_created_at, after_id, sport=sport, team_name=team_name),
+        page_size,
+    )
+    if games_page:
+        st.table([
+            {
+                "Played": game["created_at"],
+                "Sport": game["sport"],
+                "Team 1": game["team1"],
+                "Score 1": game["team1_score"],
+                "Team 2": game["team2"],
+                "Score 2": game["team2_score"],
+            }
+            for game in games_page
+        ])
+    else:
+        st.info("No past games match these filters.")
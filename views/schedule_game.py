@@ -0,0 +1,133 @@
+# views/schedule_game.py
+# The Schedule Game page: schedule one match or a whole round, and browse or cancel scheduled matches.
+
+import streamlit as st
+
+from database import (
+    delete_scheduled_match, get_all_games, get_all_teams, get_busy_team_ids, get_game_by_name,
+    get_scheduled_matches_page, get_team_match_history, get_team_ratings, insert_scheduled_match,
+    insert_scheduled_matches,
+)
+from game_logic import calculate_handicaps, schedule_game, schedule_round
+from views.widgets import keyset_pager, page_cursor
+
+
+def render():
+    st.header("Schedule a Match")
+    # Retrieve game definitions from the database and build a list of game names
+    all_games = get_all_games()
+    game_names = [game["name"] for game in all_games]
+    selected_sport = st.selectbox("Select a Sport", game_names)
+    by_rating = st.checkbox(
+        "Match by rating",
+        help="Among the teams with the fewest games played, pair those with the closest rating in the sport.",
+    )
+
+    if st.button("Schedule Match"):
+        # Retrieve game definition for the selected sport
+        game_info = get_game_by_name(selected_sport)
+        if game_info["type"] == "Single Play":
+            # For single play games, do not schedule a two-team match.
+            # Instead, insert a record indicating the game is ongoing.
+            new_match_id = insert_scheduled_match(selected_sport, None, None, [], [])
+            st.success(f"{selected_sport} Ongoing (Match ID: {new_match_id})")
+        else:
+            # For Multi Play games, schedule a match between teams.
+            scheduled_team_ids = get_busy_team_ids()
+            teams = get_all_teams()
+            available_teams = [team for team in teams if team["id"] not in scheduled_team_ids]
+
+            if len(available_teams) < 2:
+                st.warning("Not enough teams available for scheduling a new match. Please submit scores from previous matches to free up teams.")
+            else:
+                ratings = get_team_ratings([selected_sport])[selected_sport] if by_rating else None
+                match = schedule_game(available_teams, ratings)
+                if match:
+                    team1, team2 = match
+                    handicap1, handicap2 = calculate_handicaps([(team1, selected_sport), (team2, selected_sport)])
+                    new_match_id = insert_scheduled_match(selected_sport, team1["id"], team2["id"], handicap1, handicap2)
+                    st.success(f"Match scheduled! (Match ID: {new_match_id})")
+                else:
+                    st.info("No match scheduled.")
+
+    st.subheader("Schedule a Round")
+    # Fill every idle station at once: choose the sports with a free station and how many of each are free.
+    multi_play_names = [game["name"] for game in all_games if game["type"] == "Multi Play"]
+    idle_sports = st.multiselect("Sports with idle stations", multi_play_names)
+    venues = []
+    for sport in idle_sports:
+        stations = st.number_input(f"Idle {sport} stations", min_value=1, value=1, step=1, key=f"stations_{sport}")
+        venues.extend([sport] * int(stations))
+
+    if st.button("Schedule Round"):
+        scheduled_team_ids = get_busy_team_ids()
+        teams = get_all_teams()
+        available_teams = [team for team in teams if team["id"] not in scheduled_team_ids]
+        history = get_team_match_history()
+        round_matches = schedule_round(
+            venues, available_teams, history["last_opponents"], history["sport_counts"],
+            ratings=get_team_ratings(idle_sports) if by_rating else None,
+        )
+        if not round_matches:
+            st.warning("No matches scheduled. Select idle stations and make sure at least two teams are free.")
+        else:
+            # Handicaps for every team in the round are resolved with one query.
+            pairs = []
+            for sport, team1, team2 in round_matches:
+                pairs.extend([(team1, sport), (team2, sport)])
+            handicaps = calculate_handicaps(pairs)
+            new_matches = [
+                {
+                    "sport": sport,
+                    "team1_id": team1["id"],
+                    "team2_id": team2["id"],
+                    "handicap1": handicaps[2 * i],
+                    "handicap2": handicaps[2 * i + 1],
+                }
+                for i, (sport, team1, team2) in enumerate(round_matches)
+            ]
+            new_match_ids = insert_scheduled_matches(new_matches)
+            st.success(f"Scheduled {len(new_match_ids)} matches (Match IDs: {', '.join(str(i) for i in new_match_ids)}).")
+            if len(round_matches) < len(venues):
+                st.info(f"{len(venues) - len(round_matches)} stations left idle: not enough free teams.")
+
+    # Display one page of scheduled matches at a time
+    st.subheader("Currently Scheduled Matches")
+    page_size = st.number_input("Matches per page", min_value=5, max_value=100, value=20, step=5)
+    after_created_at, after_id = page_cursor("scheduled_matches_pages")
+    matches = keyset_pager(
+        "scheduled_matches_pages",
+        get_scheduled_matches_page(page_size + 1, after_created_at, after_id),
+        page_size,
+    )
+    if matches:
+        for m in matches:
+            st.write("**Match ID:**", m["id"])
+            st.write("**Sport:**", m["sport"])
+            if m["team1_id"] is None:
+                # Single Play game ongoing record
+                st.write(f"{m['sport']} Ongoing")
+            else:
+                st.write("**Team 1:**", m["team1_name"] or "Unknown", " | Handicap:",
+                         m["handicap1"][0] if m["handicap1"] and m["handicap1"][0] else "None")
+                st.write("**Team 2:**", m["team2_name"] or "Unknown", " | Handicap:",
+                         m["handicap2"][0] if m["handicap2"] and m["handicap2"][0] else "None")
+            st.markdown("---")
+    else:
+        st.info("No scheduled matches available.")
+    
+    # Option to cancel a scheduled match on the page shown above
+    st.subheader("Cancel a Scheduled Match")
+    if matches:
+        cancel_options = {}
+        for m in matches:
+            if m["team1_id"] is None:
+                desc = f"{m['sport']} Ongoing (Match ID: {m['id']})"
+            else:
+                desc = f"{m['sport']}: {m['team1_name'] or 'Unknown'} vs {m['team2_name'] or 'Unknown'} (Match ID: {m['id']})"
+            cancel_options[desc] = m["id"]
+        selected_cancel = st.selectbox("Select a match to cancel", list(cancel_options.keys()))
+        cancel_match_id = cancel_options[selected_cancel]
+        if st.button("Cancel Scheduled Match"):
+            delete_scheduled_match(cancel_match_id)
+            st.success(f"Match {cancel_match_id} canceled successfully.")
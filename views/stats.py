@@ -0,0 +1,63 @@
+# views/stats.py
+# The Stats page: win rates, margins, overtime frequency, points per game and head-to-head records from PastGames.
+
+import streamlit as st
+
+from analytics import get_stats
+from database import get_sport_ratings
+
+_COLUMNS = {
+    "team": "Team",
+    "sport": "Sport",
+    "games": "Games",
+    "wins": "Wins",
+    "losses": "Losses",
+    "draws": "Draws",
+    "win_rate": "Win Rate",
+    "avg_margin": "Avg Margin",
+    "overtime_rate": "Overtime Rate",
+    "points_per_game": "Points per Game",
+}
+_FORMATS = {
+    "Win Rate": st.column_config.NumberColumn(format="percent"),
+    "Overtime Rate": st.column_config.NumberColumn(format="percent"),
+    "Avg Margin": st.column_config.NumberColumn(format="%.2f"),
+    "Points per Game": st.column_config.NumberColumn(format="%.2f"),
+}
+
+
+def render():
+    st.header("Stats")
+    stats = get_stats()
+    if stats.totals.empty:
+        st.info("No team games have been played yet.")
+        return
+    st.caption(f"From {stats.rows} past games. Overtime means a Multi Play game decided by 2 points or less.")
+    sport_filter = st.selectbox("Sport", ["All"] + stats.sports())
+    sport = None if sport_filter == "All" else sport_filter
+
+    st.subheader("Teams")
+    table = stats.team_stats() if sport is None else stats.team_sport_stats(sport).drop(columns="sport")
+    st.dataframe(
+        table[[column for column in _COLUMNS if column in table.columns]].rename(columns=_COLUMNS),
+        hide_index=True, column_config=_FORMATS,
+    )
+
+    if sport is not None:
+        st.subheader("Ratings")
+        rated = get_sport_ratings(sport)
+        if rated:
+            st.dataframe(
+                [
+                    {"Team": row["team_name"], "Rating": round(row["rating"]), "Games Rated": row["games"]}
+                    for row in rated
+                ],
+                hide_index=True,
+            )
+        else:
+            st.caption(f"No {sport} results have been rated yet.")
+
+    st.subheader("Head to Head")
+    value = st.radio("Show", ["Wins", "Games"], horizontal=True, key="stats_head_to_head")
+    st.caption("Each row is a team; each column the opponent.")
+    st.dataframe(stats.head_to_head(sport, value.lower()))
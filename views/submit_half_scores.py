@@ -0,0 +1,44 @@
+# views/submit_half_scores.py
+# The Submit Half Scores page: games between a full team and two half teams.
+
+import streamlit as st
+
+from database import get_all_games, get_all_teams, get_game_by_name, submit_half_score
+
+
+def render():
+    st.header("Submit Half Scores")
+    
+    # Retrieve all teams and available games
+    teams = get_all_teams()
+    team_names = [team["team_name"] for team in teams]
+    all_games = get_all_games()
+    sport_names = [game["name"] for game in all_games]
+    
+    # Dropdowns for team selection
+    full_team_name = st.selectbox("Full Team", team_names)
+    half_team1_name = st.selectbox("Half Team 1", team_names)
+    half_team2_name = st.selectbox("Half Team 2", team_names)
+    
+    # Dropdown for sport selection
+    selected_sport = st.selectbox("Select Sport", sport_names)
+    
+    # Radio button to choose the winner type
+    winning_side = st.radio("Select Winner", ("Full Team Wins", "Half Teams Win"))
+    
+    if st.button("Submit Score"):
+        full_team = next((t for t in teams if t["team_name"] == full_team_name), None)
+        team1 = next((t for t in teams if t["team_name"] == half_team1_name), None)
+        team2 = next((t for t in teams if t["team_name"] == half_team2_name), None)
+        if not get_game_by_name(selected_sport):
+            st.error("Game information not found for the selected sport!")
+        elif not (full_team and team1 and team2):
+            st.error("Selected team not found.")
+        else:
+            # Points, streaks and tokens come from scoring.score_half and are applied in one transaction.
+            delta = submit_half_score(full_team["id"], team1["id"], team2["id"], selected_sport,
+                                      winning_side == "Full Team Wins")
+            if winning_side == "Full Team Wins":
+                st.success(f"{full_team_name} awarded {delta.points_awarded} points!")
+            else:
+                st.success(f"{half_team1_name} and {half_team2_name} each awarded {delta.points_awarded} points!")
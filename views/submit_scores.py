@@ -0,0 +1,131 @@
+# views/submit_scores.py
+# The Submit Scores page: results of Multi Play matches, Single Play games, individual events and Duels.
+
+import streamlit as st
+
+from database import (
+    award_placements, get_all_teams, get_game_by_name, get_roster, get_scheduled_matches, submit_duel_result,
+    submit_match_result, submit_single_play_result,
+)
+from scoring import PLACEMENT_POINTS, place_label
+
+
+def render():
+    st.header("Submit Match Scores")
+    
+    # Retrieve scheduled matches from the database
+    matches = get_scheduled_matches()
+    
+    if not matches:
+        st.info("There are no scheduled matches at the moment.")
+    else:
+        # Create a dictionary mapping a descriptive key to the match record
+        match_options = {}
+        teams_all = get_all_teams()  # Cache team list for efficiency
+        for m in matches:
+            team1 = next((t for t in teams_all if t["id"] == m["team1_id"]), {"team_name": "Unknown"})
+            team2 = next((t for t in teams_all if t["id"] == m["team2_id"]), {"team_name": "Unknown"})
+            desc = f"{m['sport']}: {team1['team_name']} vs {team2['team_name']} (ID: {m['id']})"
+            match_options[desc] = m["id"]
+
+        selected_desc = st.selectbox("Select a Scheduled Match", list(match_options.keys()))
+        match_id = match_options[selected_desc]
+        selected_match = next((m for m in matches if m["id"] == match_id), None)
+
+        if selected_match:
+            # Retrieve game definition to determine type and point value
+            game_info = get_game_by_name(selected_match["sport"])
+            if selected_match["sport"] == "Duel":
+                # Duels are scheduled from a Duel token: team 1 is the current King, team 2 the challenger.
+                king_team = next((t for t in teams_all if t["id"] == selected_match["team1_id"]), {"team_name": "Unknown"})
+                challenger = next((t for t in teams_all if t["id"] == selected_match["team2_id"]), {"team_name": "Unknown"})
+                st.write(f"Duel: {king_team['team_name']} (King) vs {challenger['team_name']} (Challenger)")
+                duel_winner_name = st.radio("Duel Winner", (king_team["team_name"], challenger["team_name"]))
+                if st.button("Submit Duel Result"):
+                    if duel_winner_name == challenger["team_name"]:
+                        winner, loser = challenger, king_team
+                    else:
+                        winner, loser = king_team, challenger
+                    # The crown, the points, the PastGames record and the match removal are applied atomically.
+                    outcome = submit_duel_result(selected_match["id"], winner["id"])
+                    if outcome is None:
+                        st.warning("This match has already been submitted.")
+                    else:
+                        st.success(f"{winner['team_name']} won the Duel and took {outcome['points']} points from {loser['team_name']}!")
+            elif not game_info:
+                st.error("Game definition not found!")
+            elif game_info["type"] == "Multi Play":
+                st.write("**Match Details:**")
+                # Retrieve team details
+                team1 = next((t for t in teams_all if t["id"] == selected_match["team1_id"]), {"team_name": "Unknown"})
+                team2 = next((t for t in teams_all if t["id"] == selected_match["team2_id"]), {"team_name": "Unknown"})
+                st.write(f"Sport: {selected_match['sport']}")
+                st.write(f"Team 1: {team1['team_name']} | Handicap:",
+                         selected_match['handicap1'][0] if selected_match['handicap1'] else "None")
+                st.write(f"Team 2: {team2['team_name']} | Handicap:",
+                         selected_match['handicap2'][0] if selected_match['handicap2'] else "None")
+                col1, col2 = st.columns(2)
+                with col1:
+                    team1_score = st.number_input(f"{team1['team_name']} Score", min_value=0, step=1)
+                with col2:
+                    team2_score = st.number_input(f"{team2['team_name']} Score", min_value=0, step=1)
+
+                if st.button("Submit Scores for Match"):
+                    # Points, tokens, streaks, the PastGames record and the match removal are applied atomically.
+                    outcome = submit_match_result(selected_match["id"], team1_score, team2_score)
+                    if outcome is None:
+                        st.warning("This match has already been submitted.")
+                    else:
+                        if outcome["comeback_used"]:
+                            winner = team1 if outcome["winner_id"] == team1["id"] else team2
+                            st.info(f"{winner['team_name']} used a Comeback token for double points!")
+                        st.success("Match scores submitted, tokens updated, win streak updated, match cleared, and record saved to past games!")
+            
+            elif game_info["type"] == "Single Play":
+                if selected_match["sport"] in PLACEMENT_POINTS:
+                    # Individual event: players are placed and their points go to their teams.
+                    sport = selected_match["sport"]
+                    st.subheader(f"{sport} Score Submission")
+                    players = [player["name"] for player in get_roster()["players"]]
+                    points_text = st.text_input(
+                        "Points per place (1st, 2nd, ...)", ", ".join(str(p) for p in PLACEMENT_POINTS[sport])
+                    )
+                    try:
+                        points_table = [int(points) for points in points_text.split(",") if points.strip()]
+                    except ValueError:
+                        st.error("Points per place must be whole numbers separated by commas.")
+                        points_table = []
+                    placements = []
+                    for place in range(1, len(points_table) + 1):
+                        options = [p for p in players if p not in placements]
+                        if not options:
+                            break
+                        placements.append(st.selectbox(f"Select {place_label(place)} Place", options, key=f"place_{place}"))
+
+                    if st.button(f"Submit {sport} Scores"):
+                        if not placements:
+                            st.error("Add players to the roster in the Admin Panel first.")
+                        else:
+                            awarded = award_placements(sport, placements, points_table, match_id=selected_match["id"])
+                            if awarded is None:
+                                st.warning("This match has already been submitted.")
+                            else:
+                                st.success(f"{sport} scores submitted, {sum(awarded.values())} points awarded to "
+                                           f"{len(awarded)} teams, and record saved to past games!")
+                else:
+                    st.subheader("Single Play Score Submission")
+                    teams_all = get_all_teams()  # Refresh team list if needed
+                    first_place = st.selectbox("Select 1st Place Team", [team["team_name"] for team in teams_all])
+                    second_place = st.selectbox("Select 2nd Place Team", [team["team_name"] for team in teams_all if team["team_name"] != first_place])
+                    if st.button("Submit Single Play Scores"):
+                        team1 = next((t for t in teams_all if t["team_name"] == first_place), None)
+                        team2 = next((t for t in teams_all if t["team_name"] == second_place), None)
+                        if team1 and team2:
+                            # Points, games played, the PastGames record and the match removal are applied atomically.
+                            outcome = submit_single_play_result(selected_match["id"], team1["id"], team2["id"])
+                            if outcome is None:
+                                st.warning("This match has already been submitted.")
+                            else:
+                                st.success("Single play scores submitted, points awarded, and record saved to past games!")
+                        else:
+                            st.error("Error: Could not find selected teams.")
@@ -0,0 +1,57 @@
+# views/token_management.py
+# The Token Management page: spend the tokens teams hold.
+
+import streamlit as st
+
+from database import adjust_token, get_shared_snapshot, insert_scheduled_match
+from token_data import tokens as token_definitions
+
+
+def render():
+    st.header("Token Management")
+    tokens_found = False
+    snapshot, _ = get_shared_snapshot()
+    teams = snapshot.teams
+    # Loop over each team and read its tokens from the snapshot.
+    # Exclude the "Comeback" token since that is auto‐applied.
+    for team in teams:
+        team_tokens = snapshot.tokens_by_team.get(team["id"], {})
+        # Filter out "Comeback" tokens
+        filtered_tokens = {k: v for k, v in team_tokens.items() if k != "Comeback" and v > 0}
+        if filtered_tokens:
+            tokens_found = True
+            st.subheader(f"Team: {team['team_name']} (ID: {team['id']})")
+            for token_name, count in filtered_tokens.items():
+                st.write(f"**{token_name}:** {count} available")
+                token_info = token_definitions.get(token_name, {})
+                st.write(f"**Benefit:** {token_info.get('benefit', 'No benefit info available')}")
+                # For Duel token, schedule a duel match instead of direct usage.
+                if token_name == "Duel":
+                    if st.button(f"Use {token_name} for {team['team_name']}", key=f"use_{token_name}_{team['id']}"):
+                        # Retrieve current king (team with king == True)
+                        kings = [t for t in teams if t.get("king")]
+                        if not kings:
+                            st.error("No current king available for a duel.")
+                        # Deduct one Duel token.
+                        elif adjust_token(team["id"], token_name, -1) is None:
+                            st.error(f"{team['team_name']} has no {token_name} token left.")
+                        else:
+                            current_king = kings[0]
+                            # Schedule a Duel match (Single Play type) with 5 points.
+                            duel_match_id = insert_scheduled_match("Duel", current_king["id"], team["id"], [], [])
+                            st.success(f"Duel scheduled! (Match ID: {duel_match_id})")
+                else:
+                    if st.button(f"Use {token_name} for {team['team_name']}", key=f"use_{token_name}_{team['id']}"):
+                        if adjust_token(team["id"], token_name, -1) is None:
+                            st.error(f"{team['team_name']} has no {token_name} token left.")
+                        else:
+                            st.success(f"Used {token_name} for {team['team_name']}.")
+            st.markdown("---")
+    if not tokens_found:
+        st.info("No tokens available for any team.")
+    st.subheader("Token Definitions")
+    for token_name, info in token_definitions.items():
+        st.write(f"**{token_name}**")
+        st.write(f"**How to Earn:** {info.get('earn', '')}")
+        st.write(f"**Benefit:** {info.get('benefit', '')}")
+        st.markdown("---")
@@ -0,0 +1,29 @@
+# views/widgets.py
+# Widgets shared by several pages.
+
+import streamlit as st
+
+
+def keyset_pager(key: str, rows: list, page_size: int):
+    """
+    Shows Previous/Next buttons for a list paginated by (created_at, id) and trims the extra row used to
+    detect a next page. The cursors of the pages before the current one are kept in session state under `key`.
+    Returns the rows of the current page.
+    """
+    cursors = st.session_state.setdefault(key, [])
+    page = rows[:page_size]
+    col1, col2 = st.columns(2)
+    col1.button("Previous", key=f"{key}_previous", disabled=not cursors, on_click=cursors.pop)
+    col2.button(
+        "Next", key=f"{key}_next", disabled=len(rows) <= page_size,
+        on_click=cursors.append, args=((page[-1]["created_at"], page[-1]["id"]) if page else None,),
+    )
+    return page
+
+
+def page_cursor(key: str):
+    """
+    Returns the (after_created_at, after_id) cursor of the current page of the list stored under `key`.
+    """
+    cursors = st.session_state.get(key)
+    return cursors[-1] if cursors else (None, None)